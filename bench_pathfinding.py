@@ -0,0 +1,98 @@
+import os
+import random
+import time
+
+# Sin ventana ni audio (se puede forzar otro driver desde el entorno)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import config
+from core.app import App
+from core.maps import LEVEL_MAPS
+from screens.gameplay import GamePlayScreen
+
+# ==========================================================
+#  MEDICIÓN DEL PATHFINDING EN UN MAPA GRANDE
+# ----------------------------------------------------------
+#  Arma un nivel sintético (por defecto 200×200, con varios
+#  enemigos), lo juega sin ventana y muestra qué código de
+#  búsqueda se usó: grafo HPA, A* completo, campo de
+#  distancias compartido y rutas guardadas.
+#
+#  Uso:  python bench_pathfinding.py
+# ==========================================================
+MAP_SIZE = 200
+ENEMY_RATE = 0.001     # probabilidad de enemigo por celda sin muro
+BLOCK_RATE = 0.08      # probabilidad de bloque destructible
+FRAMES = 600
+
+
+def synthetic_level(size=MAP_SIZE, seed=0):
+    """Filas de un nivel size×size con el jugador en el centro."""
+    rng = random.Random(seed)
+    rows = []
+    for y in range(size):
+        row = []
+        for x in range(size):
+            if x in (0, size - 1) or y in (0, size - 1) or (x % 2 == 0 and y % 2 == 0):
+                row.append("S")
+            elif (x, y) == (size // 2 - 1, size // 2 - 1):
+                row.append("P")
+            elif (x, y) == (1, 1):
+                row.append("O")
+            elif x > 3 and y > 3 and rng.random() < ENEMY_RATE:
+                row.append("E")
+            elif rng.random() < BLOCK_RATE:
+                row.append("B")
+            else:
+                row.append(" ")
+        rows.append("".join(row))
+    return rows
+
+
+def play(game, frames=FRAMES):
+    """Juega `frames` frames de 16 ms; devuelve ms por update()."""
+    # El jugador cambia de dirección cada medio segundo (y no muere)
+    keys = (pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT, pygame.K_UP)
+    t0 = time.perf_counter()
+    for f in range(frames):
+        if f % 30 == 0:
+            for key in keys:
+                game.handle_event(pygame.event.Event(pygame.KEYUP, key=key))
+            game.handle_event(pygame.event.Event(pygame.KEYDOWN, key=keys[f // 30 % 4]))
+        game.player.invincible = True
+        game.update(16)
+    return (time.perf_counter() - t0) * 1000 / frames
+
+
+def main():
+    pygame.init()
+    app = App()
+    app.preloader.finish()
+
+    # GamePlayScreen lee el nivel de LEVEL_MAPS: el sintético se
+    # agrega sólo mientras se arma la partida
+    LEVEL_MAPS.append(synthetic_level())
+    try:
+        t0 = time.perf_counter()
+        game = GamePlayScreen(app, config.DIFFICULTIES[0], len(LEVEL_MAPS) - 1)
+        build_ms = (time.perf_counter() - t0) * 1000
+    finally:
+        LEVEL_MAPS.pop()
+
+    print(f"Mapa {game.map.width}x{game.map.height}, {len(game.enemies)} enemigos, "
+          f"HPA: {'sí' if game.hpa is not None else 'no'} (nivel armado en {build_ms:.0f} ms)")
+
+    update_ms = play(game)
+
+    print(f"update(): {update_ms:.2f} ms por frame ({FRAMES} frames)")
+    if game.hpa is not None:
+        print(f"HPA: {game.hpa.abstract_searches} por grafo / {game.hpa.fallbacks} A* completo")
+    print(f"A* cortadas por el límite: {game.astar.truncated}")
+    print(f"Rutas: {game.path_hits} aciertos / {game.path_misses} fallos")
+    print(f"Campo de distancias: {game.distance_field.rebuilds} BFS")
+
+
+if __name__ == "__main__":
+    main()
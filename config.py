@@ -6,6 +6,17 @@ WIDTH = 1024
 HEIGHT = 576
 FPS = 60
 
+# Dirty-rect: en vez de mostrar la ventana completa cada frame, las
+# pantallas informan qué zonas cambiaron y sólo esas se actualizan
+# (menos trabajo de CPU en equipos modestos)
+DIRTY_RECTS = False
+
+# Render a demanda: las pantallas que no necesitan animarse (menús)
+# esperan eventos con pygame.event.wait en vez de redibujar a 60 FPS.
+# IDLE_WAIT_MS es el máximo que se espera antes de volver a revisar.
+RENDER_ON_DEMAND = True
+IDLE_WAIT_MS = 250
+
 # Colores generales
 COLOR_BG = (10, 10, 20)
 COLOR_PANEL = (20, 20, 40)
@@ -48,6 +59,7 @@ DIFFICULTY_CONFIG = {
 }
 FONT_PATH = "assets/fonts/game.ttf"
 LOCK_IMAGE_PATH = "assets/images/lock.png"
+FLOOR_IMAGE_PATH = "assets/images/grass.jpg"   # piso de los niveles
 
 MUSIC_MENU = "assets/music/menu.mp3"
 MUSIC_DIFFICULTY = "assets/music/menu.mp3"
@@ -58,5 +70,34 @@ MUSIC_DEFEAT = "assets/music/menu.mp3"
 
 SAVE_FILE = "save.json"
 
+# Paquete binario con todas las imágenes ya escaladas (ver core/bundle.py).
+# Se regenera automáticamente si cambian los archivos de assets/images.
+ASSET_BUNDLE_PATH = "assets/bundle.bin"
+
+# Margen (px) que se recorta a cada lado del sprite de jugador y
+# enemigos para las colisiones entre ellos y con explosiones
+HITBOX_INSET = 8
+
+# Con al menos esta cantidad de enemigos, comparten un único campo de
+# distancias hacia el jugador en lugar de buscar un camino cada uno
+# (salvo en mapas con HPA, ver HPA_MIN_TILES)
+DISTANCE_FIELD_MIN_ENEMIES = 2
+
+# Máximo de tiles que expande una búsqueda A* de un enemigo (None =
+# sin límite). Al agotarse, el enemigo avanza por una ruta parcial.
+# Sólo limita las búsquedas por enemigo: el campo de distancias
+# compartido (DISTANCE_FIELD_MIN_ENEMIES) siempre recorre todo el mapa,
+# por eso en mapas con HPA no se usa
+PATH_NODE_BUDGET = 2000
+
+# Mapas con al menos esta cantidad de tiles usan pathfinding jerárquico
+# (clusters de HPA_CLUSTER_SIZE × HPA_CLUSTER_SIZE, ver core/hpa.py)
+HPA_MIN_TILES = 10000
+HPA_CLUSTER_SIZE = 10
+
 DIFFICULTIES = ["Fácil", "Medio", "Difícil"]
 LEVELS_PER_DIFFICULTY = 5
+
+# Modo depuración: muestra información técnica extra en pantalla
+# y avisa por consola si se leen archivos en mitad de la partida
+DEBUG = False
@@ -1,7 +1,12 @@
 import pygame
+import config
 from config import WIDTH, HEIGHT, FPS
 from core.save_manager import SaveManager
 from core.utils import load_font
+from core.glyphs import GlyphAtlas
+from core import assets
+from core.bundle import open_bundle
+from core.preload import AsyncPreloader, full_manifest
 from screens.main_menu import MainMenuScreen
 
 
@@ -33,6 +38,19 @@ class App:
         self.font_medium = load_font(26)
         self.font_large = load_font(40)
 
+        # Atlas de glifos (dígitos y letras del HUD): los contadores
+        # se arman con blits sin rasterizar TrueType. Sólo el tamaño
+        # chico cambia cada frame; los textos medianos y grandes
+        # (títulos, botones, pantallas de fin) son fijos y ya los
+        # guarda render_text
+        self.glyphs_small = GlyphAtlas(self.font_small, config.COLOR_TEXT)
+
+        # ------------------------------------------------------
+        # Paquete de imágenes precompilado (se regenera si cambió
+        # algún archivo de assets/images)
+        # ------------------------------------------------------
+        assets.use_bundle(open_bundle(config.ASSET_BUNDLE_PATH))
+
         # ------------------------------------------------------
         # Cargar archivo de guardado (niveles desbloqueados)
         # ------------------------------------------------------
@@ -41,17 +59,40 @@ class App:
         # Música actualmente activa (para evitar recargar)
         self.current_music = None
 
+        # ------------------------------------------------------
+        # Precarga en segundo plano de los recursos de juego
+        # (empezando por el último nivel seleccionado) mientras
+        # se muestran los menús
+        # ------------------------------------------------------
+        self.preloader = None
+        self.start_preload()
+
         # ------------------------------------------------------
         # Inicializar la pantalla principal del menú
         # ------------------------------------------------------
         self.current_screen = MainMenuScreen(self)
         self.current_screen.on_enter()   # Llama a la música y configuraciones iniciales
 
+    # ======================================================
+    # (Re)inicia la precarga en segundo plano, empezando por el
+    # último nivel seleccionado. Tras assets.clear() vuelve a
+    # llenar la caché (y arma un atlas nuevo) para la próxima
+    # partida.
+    # ======================================================
+    def start_preload(self):
+        if self.preloader is not None:
+            self.preloader.cancel()
+        self.preloader = AsyncPreloader(full_manifest(
+            floor_path=config.FLOOR_IMAGE_PATH,
+            first_level=self.save_data["selected_level"]
+        ))
+
     # ======================================================
     # Cambia la pantalla actual
     # screen → instancia de cualquier clase derivada de BaseScreen
     # ======================================================
     def change_screen(self, screen):
+        self.current_screen.on_exit()  # La pantalla saliente limpia su estado
         self.current_screen = screen
         screen.on_enter()  # Cada pantalla define qué hacer al entrar en ella
 
@@ -64,29 +105,80 @@ class App:
             # -------------------------
             # Manejo de eventos
             # -------------------------
-            for event in pygame.event.get():
+            for event in self._next_events():
                 if event.type == pygame.QUIT:
                     # Guardar progreso antes de cerrar
                     SaveManager.save(self.save_data)
+                    self.preloader.cancel()
                     pygame.quit()
                     return
 
                 # Pasar eventos a la pantalla actual
                 self.current_screen.handle_event(event)
 
+                # Teclas y clicks pueden cambiar cualquier parte de la
+                # pantalla → el próximo frame se muestra completo
+                if event.type != pygame.MOUSEMOTION:
+                    self.current_screen.invalidate()
+
+            # -------------------------
+            # Recursos precargados en segundo plano
+            # -------------------------
+            if not self.preloader.done:
+                self.preloader.poll()
+
             # -------------------------
             # Lógica de juego
             # -------------------------
             self.current_screen.update()
 
             # -------------------------
-            # Dibujar pantalla
+            # Dibujar pantalla (las pantallas en reposo sólo si
+            # algo cambió: input, hover o invalidate())
             # -------------------------
-            self.current_screen.draw()
-
-            # Mostrar frame
-            pygame.display.flip()
+            if not self._is_idle() or self.current_screen.needs_redraw():
+                self._present()
 
             # Mantener FPS estables
             self.clock.tick(FPS)
 
+    # ======================================================
+    # Render a demanda
+    # ------------------------------------------------------
+    # Una pantalla está "en reposo" si no necesita actualizarse
+    # continuamente (menús) y no hay precarga en curso.
+    # ======================================================
+    def _is_idle(self):
+        return (config.RENDER_ON_DEMAND
+                and not self.current_screen.continuous
+                and self.preloader.done)
+
+    def _next_events(self):
+        """
+        Eventos pendientes. En reposo, bloquea hasta que llegue uno
+        (o pase IDLE_WAIT_MS) en lugar de girar a 60 FPS sin hacer nada.
+        """
+        if self._is_idle():
+            event = pygame.event.wait(config.IDLE_WAIT_MS)
+            if event.type != pygame.NOEVENT:
+                return [event] + pygame.event.get()
+        return pygame.event.get()
+
+    # ======================================================
+    # Dibuja la pantalla actual y muestra el frame
+    # ======================================================
+    def _present(self):
+        self.current_screen.draw()
+
+        # Mostrar frame: completo, o sólo las zonas que cambiaron
+        if config.DIRTY_RECTS:
+            rects = self.current_screen.get_dirty_rects()
+            if rects is None:
+                pygame.display.flip()
+            elif rects:
+                pygame.display.update(rects)
+        else:
+            pygame.display.flip()
+
+        self.current_screen.mark_drawn()
+
@@ -0,0 +1,210 @@
+import os
+import pygame
+import config
+from core.atlas import TextureAtlas
+
+# ==========================================================
+#  CACHÉ CENTRAL DE SPRITES
+# ----------------------------------------------------------
+#  Todas las entidades (bloques, enemigos, bombas, ítems,
+#  portal...) piden sus imágenes aquí en lugar de llamar a
+#  pygame.image.load en su propio __init__.
+#
+#  Cada imagen se decodifica y escala UNA sola vez por
+#  combinación (ruta, tamaño). Las entidades comparten la
+#  misma Surface, así que 150 bloques = 1 imagen en memoria.
+# ==========================================================
+
+# (ruta, tamaño) → Surface ya convertida y escalada
+_images = {}
+
+# (patrón, tamaño, índice inicial) → lista de Surfaces
+_sequences = {}
+
+# Paquete binario abierto (core/bundle.py) o None
+_bundle = None
+
+# Atlas ya construidos y claves que ya viven dentro de alguno
+_atlases = []
+_packed = set()
+
+# ----------------------------------------------------------
+# Control de acceso a disco durante la partida
+# ----------------------------------------------------------
+# Mientras _gameplay_active sea True, cualquier lectura de
+# disco se considera "tardía" (debió estar en el manifiesto
+# de precarga). Se cuentan siempre y, con config.DEBUG, además
+# se avisan por consola.
+_gameplay_active = False
+late_loads = 0
+
+
+def _touch_disk(path):
+    """Registra un acceso a disco (y lo señala si es durante la partida)."""
+    global late_loads
+    if _gameplay_active:
+        late_loads += 1
+        if config.DEBUG:
+            print(f"[assets] acceso a disco durante la partida: {path}")
+
+
+def begin_gameplay():
+    """A partir de aquí, todo acceso a disco se cuenta como tardío."""
+    global _gameplay_active, late_loads
+    _gameplay_active = True
+    late_loads = 0
+
+
+def end_gameplay():
+    global _gameplay_active
+    _gameplay_active = False
+
+
+# ==========================================================
+#  decode_image(path, size) / finish_image(raw, size)
+# ----------------------------------------------------------
+#  La carga se divide en dos mitades para poder adelantarla
+#  en un hilo (ver core/preload.py):
+#
+#  decode_image → parte pesada y segura en hilos: lee del
+#                 paquete o decodifica el archivo. Devuelve
+#                 (surface, lista) donde lista=True indica
+#                 que ya está convertida y escalada.
+#  finish_image → convert_alpha + scale. Toca el formato de
+#                 la pantalla, así que sólo en el hilo principal.
+# ==========================================================
+def decode_image(path, size=None):
+    # Primero el paquete precompilado (sin decodificar nada)
+    if _bundle is not None:
+        img = _bundle.image(path, size)
+        if img is not None:
+            return img, True
+    _touch_disk(path)
+    return pygame.image.load(path), False
+
+
+def finish_image(raw, size=None):
+    img = raw.convert_alpha()
+    if size is not None:
+        img = pygame.transform.scale(img, size)
+    return img
+
+
+def store_image(path, size, img):
+    """Guarda una imagen ya preparada (no pisa una existente)."""
+    return _images.setdefault((path, size), img)
+
+
+# ==========================================================
+#  load_image(path, size)
+# ----------------------------------------------------------
+#  Devuelve la imagen en `path` escalada a `size` (w, h).
+#  Si size es None se devuelve en su tamaño original.
+#  Lanza la misma excepción que pygame si el archivo falta.
+# ==========================================================
+def load_image(path, size=None):
+    img = _images.get((path, size))
+    if img is None:
+        img, ready = decode_image(path, size)
+        if not ready:
+            img = finish_image(img, size)
+        img = store_image(path, size, img)
+    return img
+
+
+def is_cached(path, size=None):
+    return (path, size) in _images
+
+
+# ==========================================================
+#  sequence_paths(pattern, size, start)
+# ----------------------------------------------------------
+#  Rutas de una animación numerada: pattern.format(i) para
+#  i = start, start+1, ... hasta que deje de existir archivo.
+#  Si el paquete la conoce, no se consulta el disco.
+# ==========================================================
+def sequence_paths(pattern, size=None, start=0):
+    count = _bundle.sequence_count(pattern, size, start) if _bundle else None
+    if count is not None:
+        return [pattern.format(i) for i in range(start, start + count)]
+
+    paths = []
+    i = start
+    _touch_disk(pattern)
+    while os.path.exists(pattern.format(i)):
+        paths.append(pattern.format(i))
+        i += 1
+    return paths
+
+
+# ==========================================================
+#  load_sequence(pattern, size, start)
+# ----------------------------------------------------------
+#  Carga una animación numerada (ver sequence_paths).
+#  Ejemplo: "assets/images/bomb/bomb-{}.png"
+#
+#  Devuelve una lista (compartida, no modificarla).
+# ==========================================================
+def load_sequence(pattern, size=None, start=0):
+    key = (pattern, size, start)
+    frames = _sequences.get(key)
+    if frames is None:
+        frames = [load_image(p, size) for p in sequence_paths(pattern, size, start)]
+        _sequences[key] = frames
+    return frames
+
+
+# ==========================================================
+#  use_bundle(bundle)
+# ----------------------------------------------------------
+#  Activa un paquete binario (core.bundle.AssetBundle): a
+#  partir de aquí las imágenes que contenga no se leen de
+#  sus archivos originales.
+# ==========================================================
+def use_bundle(bundle):
+    global _bundle
+    _bundle = bundle
+
+
+# ==========================================================
+#  pack_atlas()
+# ----------------------------------------------------------
+#  Empaqueta en un atlas nuevo todas las imágenes cacheadas
+#  que aún no estén en uno, y reemplaza sus entradas (y las
+#  de las secuencias) por subsurfaces del atlas.
+#
+#  Debe llamarse ANTES de crear las entidades: las que ya
+#  tengan referencias a las Surfaces antiguas las conservan.
+# ==========================================================
+def pack_atlas(max_width=1024):
+    pending = {k: img for k, img in _images.items() if k not in _packed}
+    if not pending:
+        return None
+
+    atlas = TextureAtlas(max_width)
+    index = atlas.pack(pending)
+    _atlases.append(atlas)
+
+    # Surface antigua → subsurface del atlas
+    replaced = {id(pending[k]): sub for k, sub in index.items()}
+    _images.update(index)
+    _packed.update(index)
+
+    for key, frames in _sequences.items():
+        frames[:] = [replaced.get(id(f), f) for f in frames]
+
+    return atlas
+
+
+# ==========================================================
+#  clear()
+# ----------------------------------------------------------
+#  Vacía la caché completa: imágenes, secuencias y atlas. Se
+#  llama al salir de una partida; las entidades que aún
+#  tengan referencias conservan sus Surfaces.
+# ==========================================================
+def clear():
+    _images.clear()
+    _sequences.clear()
+    _atlases.clear()
+    _packed.clear()
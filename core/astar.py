@@ -0,0 +1,123 @@
+import heapq
+from array import array
+
+# ==========================================================
+#  A* SOBRE EL MAPA DEL NIVEL
+# ----------------------------------------------------------
+#  Búsqueda informada (heurística Manhattan) con todos los
+#  datos en arreglos indexados por tile (mismo orden que
+#  TileMap.data), sin dicts ni tuplas por nodo:
+#
+#    g       → costo desde el inicio
+#    parent  → tile anterior en la ruta
+#    seen    → búsqueda en la que se abrió el tile
+#    closed  → búsqueda en la que se cerró el tile
+#
+#  `seen`/`closed` guardan el número de búsqueda: no hace
+#  falta limpiar los arreglos entre una llamada y otra.
+#
+#  Con un límite de expansiones (budget), si se agota antes de
+#  llegar devuelve la ruta hasta el tile explorado más cercano
+#  al objetivo (mejor esfuerzo).
+# ==========================================================
+class AStar:
+    def __init__(self, bits):
+        self.bits = bits
+        size = bits.size
+        self.g = array("i", [0]) * size
+        self.parent = array("i", [0]) * size
+        self.seen = array("I", [0]) * size
+        self.closed = array("I", [0]) * size
+        self.search_id = 0
+
+        # Búsquedas cortadas por el límite (para depuración)
+        self.truncated = 0
+
+    def find_path(self, start, goal, budget=None):
+        """
+        Ruta de start a goal (sin incluir start) evitando los
+        tiles de bits.enemy_blocked. Devuelve [] si start == goal,
+        None si no hay camino, o una ruta parcial si se agotó
+        el presupuesto de expansiones.
+        """
+        bits = self.bits
+        blocked = bits.enemy_blocked
+        stride = bits.stride
+        pad = bits.pad
+
+        s = bits.index(*start)
+        t = bits.index(*goal)
+        if s == t:
+            return []
+        if blocked[t]:
+            return None
+
+        self.search_id += 1
+        sid = self.search_id
+        g = self.g
+        parent = self.parent
+        seen = self.seen
+        closed = self.closed
+
+        gx, gy = goal[0] + pad, goal[1] + pad
+
+        def h(i):
+            y, x = divmod(i, stride)
+            return abs(x - gx) + abs(y - gy)
+
+        # (f, h, orden, tile): a igual f se expande primero el más
+        # cercano al objetivo
+        h0 = h(s)
+        g[s] = 0
+        parent[s] = s
+        seen[s] = sid
+        open_heap = [(h0, h0, 0, s)]
+        counter = 1
+
+        best, best_h = s, h0
+        expansions = 0
+        steps = (-stride, stride, -1, 1)   # arriba, abajo, izquierda, derecha
+
+        while open_heap:
+            _, hi, _, i = heapq.heappop(open_heap)
+            if closed[i] == sid:
+                continue
+            closed[i] = sid
+
+            if i == t:
+                return self._build(s, t)
+
+            if hi < best_h:
+                best, best_h = i, hi
+
+            expansions += 1
+            if budget is not None and expansions > budget:
+                self.truncated += 1
+                return self._build(s, best) if best != s else []
+
+            gi = g[i] + 1
+            for step in steps:
+                n = i + step
+                if blocked[n] or closed[n] == sid:
+                    continue
+                if seen[n] == sid and g[n] <= gi:
+                    continue
+                seen[n] = sid
+                g[n] = gi
+                parent[n] = i
+                hn = h(n)
+                heapq.heappush(open_heap, (gi + hn, hn, counter, n))
+                counter += 1
+
+        return None
+
+    def _build(self, s, t):
+        coords = self.bits.coords
+        parent = self.parent
+        path = []
+        i = t
+        while i != s:
+            path.append(coords(i))
+            i = parent[i]
+        path.reverse()
+        return path
@@ -0,0 +1,69 @@
+import pygame
+
+# ==========================================================
+#  ATLAS DE TEXTURAS
+# ----------------------------------------------------------
+#  Empaqueta muchas Surfaces pequeñas (frames de 32x32) en
+#  una sola Surface grande y devuelve, para cada nombre, una
+#  subsurface que apunta a su región dentro del atlas.
+#
+#  Las subsurfaces se dibujan igual que cualquier Surface,
+#  pero todos los sprites comparten el mismo bloque de
+#  memoria (mejor localidad de caché) y pueden mezclarse en
+#  una sola llamada a Surface.blits().
+#
+#  Empaquetado por "estanterías": se ordenan por altura y se
+#  colocan en filas de izquierda a derecha.
+# ==========================================================
+class TextureAtlas:
+    def __init__(self, max_width=1024, padding=1):
+        self.max_width = max_width
+        self.padding = padding      # separación para evitar sangrado
+        self.surface = None         # Surface final del atlas
+        self.regions = {}           # nombre → pygame.Rect dentro del atlas
+        self.index = {}             # nombre → subsurface
+
+    # ------------------------------------------------------
+    # EMPAQUETAR
+    # ------------------------------------------------------
+    def pack(self, images):
+        """
+        images → dict nombre → Surface
+        Devuelve el índice nombre → subsurface.
+        """
+        order = sorted(images, key=lambda n: images[n].get_height(), reverse=True)
+
+        x = y = 0
+        shelf_h = 0
+        width = 0
+        for name in order:
+            w, h = images[name].get_size()
+
+            # Fila llena → abrir una nueva estantería
+            if x > 0 and x + w > self.max_width:
+                x = 0
+                y += shelf_h + self.padding
+                shelf_h = 0
+
+            self.regions[name] = pygame.Rect(x, y, w, h)
+            x += w + self.padding
+            shelf_h = max(shelf_h, h)
+            width = max(width, x)
+
+        height = y + shelf_h
+        self.surface = pygame.Surface((max(width, 1), max(height, 1)), pygame.SRCALPHA)
+        self.surface.fill((0, 0, 0, 0))
+
+        # BLEND_RGBA_MAX sobre un atlas transparente copia los píxeles
+        # tal cual (incluido el canal alfa) en vez de mezclarlos
+        for name, rect in self.regions.items():
+            self.surface.blit(images[name], rect.topleft, special_flags=pygame.BLEND_RGBA_MAX)
+
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+
+        self.index = {
+            name: self.surface.subsurface(rect)
+            for name, rect in self.regions.items()
+        }
+        return self.index
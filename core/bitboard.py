@@ -0,0 +1,102 @@
+from core.tilemap import Tile
+
+# ==========================================================
+#  BITBOARDS DEL NIVEL
+# ----------------------------------------------------------
+#  Copia del estado del mapa en enteros de Python, con un bit
+#  por tile (mismo orden que TileMap.data, borde incluido):
+#
+#    solid       → muros indestructibles (y el borde)
+#    blocks      → bloques destructibles
+#    bombs       → bombas colocadas
+#    explosions  → tiles en llamas
+#
+#  Con desplazamientos y máscaras se procesa el mapa entero de
+#  una vez: expandir todos los vecinos de un conjunto de tiles
+#  son 4 shifts, sin llamadas por celda.
+#
+#  Lo mantienen Bomb.explode (bloques y bombas que desaparecen)
+#  y GamePlayScreen (bombas nuevas, explosiones).
+# ==========================================================
+class LevelBits:
+    def __init__(self, tilemap):
+        self.stride = tilemap.stride
+        self.pad = tilemap.pad
+        self.size = len(tilemap.data)
+
+        # Todos los bits válidos del tablero
+        self.board = (1 << self.size) - 1
+
+        # Aumenta cada vez que cambian bloques o bombas (lo que bloquea
+        # el paso): quien guarde resultados derivados lo compara
+        self.version = 0
+
+        self.solid = 0
+        self.blocks = 0
+        self.bombs = 0
+        self.explosions = 0
+        for i, t in enumerate(tilemap.data):
+            if t == Tile.SOLID:
+                self.solid |= 1 << i
+            elif t == Tile.BLOCK:
+                self.blocks |= 1 << i
+
+        # Lo mismo que blocked_for_enemies() pero un byte por tile:
+        # para búsquedas que consultan tile a tile (core/astar.py)
+        self.enemy_blocked = bytearray(
+            1 if t in (Tile.SOLID, Tile.BLOCK) else 0 for t in tilemap.data
+        )
+
+    # ------------------------------------------------------
+    # COORDENADAS ↔ BITS
+    # ------------------------------------------------------
+    def index(self, x, y):
+        return (y + self.pad) * self.stride + x + self.pad
+
+    def bit(self, x, y):
+        return 1 << ((y + self.pad) * self.stride + x + self.pad)
+
+    def coords(self, index):
+        y, x = divmod(index, self.stride)
+        return x - self.pad, y - self.pad
+
+    # ------------------------------------------------------
+    # MANTENIMIENTO
+    # ------------------------------------------------------
+    def clear_block(self, x, y):
+        bit = self.bit(x, y)
+        self.blocks &= ~bit
+        self.enemy_blocked[self.index(x, y)] = 1 if self.bombs & bit else 0
+        self.version += 1
+
+    def set_bomb(self, x, y):
+        self.bombs |= self.bit(x, y)
+        self.enemy_blocked[self.index(x, y)] = 1
+        self.version += 1
+
+    def clear_bomb(self, x, y):
+        bit = self.bit(x, y)
+        self.bombs &= ~bit
+        self.enemy_blocked[self.index(x, y)] = 1 if (self.solid | self.blocks) & bit else 0
+        self.version += 1
+
+    def set_explosion(self, x, y):
+        self.explosions |= self.bit(x, y)
+
+    def clear_explosion(self, x, y):
+        self.explosions &= ~self.bit(x, y)
+
+    # ------------------------------------------------------
+    # CONSULTAS
+    # ------------------------------------------------------
+    def blocked_for_enemies(self):
+        """Máscara de tiles que un enemigo no puede pisar."""
+        return self.solid | self.blocks | self.bombs
+
+    def in_explosion(self, x, y):
+        return bool(self.explosions & self.bit(x, y))
+
+    def neighbors(self, mask):
+        """Todos los vecinos (4 direcciones) de los tiles de `mask`."""
+        s = self.stride
+        return ((mask << 1) | (mask >> 1) | (mask << s) | (mask >> s)) & self.board
@@ -0,0 +1,50 @@
+from core.tilemap import Tile
+
+# ==========================================================
+#  TABLA DE ALCANCE DE EXPLOSIONES
+# ----------------------------------------------------------
+#  Los muros sólidos no cambian durante la partida, así que
+#  para cada tile y dirección se calcula UNA vez (al cargar el
+#  nivel) cuántos tiles puede recorrer una explosión antes de
+#  chocar con uno.
+#
+#  Bomb.explode recorre sólo min(potencia, alcance) tiles y
+#  únicamente mira los obstáculos dinámicos (bloques, ítems,
+#  bombas).
+# ==========================================================
+
+# Direcciones en el mismo orden que recorre Bomb.explode
+DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+
+class BlastTable:
+    def __init__(self, tilemap):
+        self.tilemap = tilemap
+        stride = tilemap.stride
+        data = tilemap.data
+        size = len(data)
+
+        # Un bytearray por dirección, indexado como TileMap.data
+        # (alcance máximo 255, de sobra para cualquier mapa)
+        self.reach = []
+        for dx, dy in DIRECTIONS:
+            step = dy * stride + dx
+            table = bytearray(size)
+
+            # Recorrer en sentido contrario a la dirección: el alcance
+            # de un tile es 0 si el siguiente es sólido, o 1 + el del
+            # siguiente. El borde sólido evita salirse del arreglo.
+            order = range(size - 1, -1, -1) if step > 0 else range(size)
+            for i in order:
+                if data[i] == Tile.SOLID:
+                    continue
+                nxt = i + step
+                if data[nxt] != Tile.SOLID:
+                    table[i] = min(255, table[nxt] + 1)
+            self.reach.append(table)
+
+    def rays(self, x, y, power):
+        """(dx, dy, alcance) para las 4 direcciones, ya limitado por power."""
+        i = self.tilemap.index(x, y)
+        return [(dx, dy, min(power, table[i]))
+                for (dx, dy), table in zip(DIRECTIONS, self.reach)]
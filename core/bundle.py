@@ -0,0 +1,214 @@
+import json
+import mmap
+import os
+import struct
+import pygame
+import config
+
+# ==========================================================
+#  PAQUETE BINARIO DE ASSETS ("bake")
+# ----------------------------------------------------------
+#  Todas las imágenes del juego, ya escaladas al tamaño de
+#  tile y en formato de píxel BGRA (el de la pantalla), se
+#  guardan en un único archivo:
+#
+#    MAGIC | largo del índice (uint32) | índice JSON | píxeles
+#
+#  Al arrancar, el archivo se abre con mmap y cada imagen se
+#  convierte en Surface con pygame.image.frombuffer: no hay
+#  decodificación PNG/JPG ni transform.scale.
+#
+#  El índice guarda la fecha y tamaño de cada archivo fuente;
+#  si alguno cambió, el paquete se vuelve a generar solo.
+#
+#  Uso offline:  python -m core.bundle
+# ==========================================================
+
+MAGIC = b"BMBNDL01"
+PIXEL_FORMAT = "BGRA"
+
+
+def _source_stamp(path):
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _full_manifest(tile_size):
+    """Manifiesto de TODOS los niveles (lo que el juego puede llegar a usar)."""
+    from core.preload import full_manifest
+
+    return full_manifest(tile_size, config.FLOOR_IMAGE_PATH)
+
+
+# ==========================================================
+# bake(path, tile_size)
+# ----------------------------------------------------------
+# Genera el paquete. Cada imagen pasa por el mismo proceso
+# que en assets.load_image (convert_alpha + scale) para que
+# el resultado sea idéntico píxel a píxel.
+# ==========================================================
+def bake(path=config.ASSET_BUNDLE_PATH, tile_size=32):
+    # convert_alpha necesita un modo de video (ventana oculta en offline)
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+    images = []       # entradas del índice
+    sequences = []
+    chunks = []
+    offset = 0
+    seen = set()
+
+    def add_image(src, size):
+        nonlocal offset
+        if (src, size) in seen:
+            return
+        seen.add((src, size))
+
+        img = pygame.image.load(src).convert_alpha()
+        if size is not None:
+            img = pygame.transform.scale(img, size)
+        data = pygame.image.tobytes(img, PIXEL_FORMAT)
+
+        w, h = img.get_size()
+        images.append({
+            "path": src, "size": list(size) if size else None,
+            "w": w, "h": h, "offset": offset,
+            "source": _source_stamp(src)
+        })
+        chunks.append(data)
+        offset += len(data)
+
+    for entry in _full_manifest(tile_size):
+        size = entry[2]
+        if entry[0] == "image":
+            if os.path.exists(entry[1]):
+                add_image(entry[1], size)
+            continue
+
+        # Secuencia numerada: se guarda la lista de frames encontrados
+        pattern, start = entry[1], entry[3]
+        i = start
+        while os.path.exists(pattern.format(i)):
+            add_image(pattern.format(i), size)
+            i += 1
+        sequences.append({
+            "pattern": pattern, "size": list(size) if size else None,
+            "start": start, "count": i - start
+        })
+
+    header = json.dumps({
+        "format": PIXEL_FORMAT,
+        "images": images,
+        "sequences": sequences
+    }).encode("utf-8")
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for data in chunks:
+            f.write(data)
+    os.replace(tmp, path)
+    return len(images)
+
+
+# ==========================================================
+# AssetBundle
+# ----------------------------------------------------------
+# Paquete abierto con mmap. Las Surfaces que entrega
+# comparten memoria con el archivo mapeado, por eso el mmap
+# se mantiene abierto mientras viva el objeto.
+# ==========================================================
+class AssetBundle:
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} no es un paquete de assets válido")
+
+        start = len(MAGIC)
+        (header_len,) = struct.unpack("<I", self._mm[start:start + 4])
+        start += 4
+        self.header = json.loads(self._mm[start:start + header_len].decode("utf-8"))
+        self._data_start = start + header_len
+        self._view = memoryview(self._mm)
+
+        # (ruta, tamaño) → entrada del índice
+        self._images = {
+            (e["path"], tuple(e["size"]) if e["size"] else None): e
+            for e in self.header["images"]
+        }
+        # (patrón, tamaño, inicio) → cantidad de frames
+        self._sequences = {
+            (e["pattern"], tuple(e["size"]) if e["size"] else None, e["start"]): e["count"]
+            for e in self.header["sequences"]
+        }
+
+    # ------------------------------------------------------
+    # CONSULTAS
+    # ------------------------------------------------------
+    def image(self, path, size):
+        """Surface de la imagen (sin copiar píxeles), o None si no está."""
+        e = self._images.get((path, size))
+        if e is None:
+            return None
+        w, h = e["w"], e["h"]
+        begin = self._data_start + e["offset"]
+        return pygame.image.frombuffer(
+            self._view[begin:begin + w * h * 4], (w, h), self.header["format"]
+        )
+
+    def sequence_count(self, pattern, size, start):
+        """Cantidad de frames de una secuencia, o None si no está."""
+        return self._sequences.get((pattern, size, start))
+
+    def is_stale(self):
+        """True si algún archivo fuente cambió desde el último bake."""
+        for e in self.header["images"]:
+            if not os.path.exists(e["path"]):
+                return True
+            if _source_stamp(e["path"]) != e["source"]:
+                return True
+        for e in self.header["sequences"]:
+            # Un frame nuevo al final de la secuencia también invalida
+            if os.path.exists(e["pattern"].format(e["start"] + e["count"])):
+                return True
+        return False
+
+    def close(self):
+        self._view = None
+        self._mm.close()
+        self._file.close()
+
+
+# ==========================================================
+# open_bundle(path)
+# ----------------------------------------------------------
+# Abre el paquete; si falta, está dañado o desactualizado,
+# lo vuelve a generar primero. Devuelve None si no se puede
+# (el juego sigue funcionando cargando desde los archivos).
+# ==========================================================
+def open_bundle(path=config.ASSET_BUNDLE_PATH, tile_size=32):
+    try:
+        if os.path.exists(path):
+            bundle = AssetBundle(path)
+            if not bundle.is_stale():
+                return bundle
+            bundle.close()
+
+        bake(path, tile_size)
+        return AssetBundle(path)
+
+    except (OSError, ValueError, pygame.error) as e:
+        print(f"No se pudo usar el paquete de assets: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    pygame.init()
+    count = bake()
+    print(f"{config.ASSET_BUNDLE_PATH}: {count} imágenes")
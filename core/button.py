@@ -1,4 +1,5 @@
 import pygame
+from core.utils import render_text
 from config import COLOR_BUTTON, COLOR_BUTTON_HOVER, COLOR_TEXT
 
 class Button:
@@ -11,14 +12,33 @@ class Button:
         self.bg_color = bg_color
         self.hover_color = hover_color
 
+        # Estado hover del último draw y si cambió desde entonces
+        # (modo dirty-rect: sólo se actualiza el botón que cambió)
+        self.hovered = False
+        self.dirty = True
+
     def draw(self, surface):
-        mouse_pos = pygame.mouse.get_pos()
-        color = self.hover_color if self.rect.collidepoint(mouse_pos) else self.bg_color
+        hovered = self.rect.collidepoint(pygame.mouse.get_pos())
+        if hovered != self.hovered:
+            self.hovered = hovered
+            self.dirty = True
+
+        color = self.hover_color if hovered else self.bg_color
         pygame.draw.rect(surface, color, self.rect, border_radius=14)
 
-        label = self.font.render(self.text, True, COLOR_TEXT)
+        label = render_text(self.font, self.text, True, COLOR_TEXT)
         surface.blit(label, label.get_rect(center=self.rect.center))
 
+    def hover_changed(self):
+        """¿El mouse entró o salió del botón desde el último draw?"""
+        return self.rect.collidepoint(pygame.mouse.get_pos()) != self.hovered
+
+    def consume_dirty(self):
+        """Devuelve si el botón cambió desde la última consulta."""
+        dirty = self.dirty
+        self.dirty = False
+        return dirty
+
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.rect.collidepoint(event.pos):
@@ -0,0 +1,90 @@
+from core.tilemap import Tile
+
+# ==========================================================
+#  RESOLUCIÓN DE REACCIONES EN CADENA
+# ----------------------------------------------------------
+#  Antes cada bomba alcanzada por una explosión quedaba con
+#  timer = 0 y explotaba en algún frame posterior según el
+#  orden de la lista de bombas, creando explosiones repetidas
+#  en los tiles que se solapaban.
+#
+#  detonate() resuelve toda la cadena en el mismo tick:
+#    1. Lista de trabajo de bombas: cada rayo que pisa otra
+#       bomba (índice de ocupación) la agrega a la lista.
+#    2. Los rayos se calculan sobre el estado del mapa ANTES
+#       de destruir nada → el resultado no depende del orden.
+#    3. Una sola Explosion para toda la cadena (centro y brazos
+#       de cada bomba), y bloques/ítems destruidos una sola
+#       vez al final.
+#
+#  Costo: proporcional a la cantidad total de tiles de rayo.
+# ==========================================================
+def detonate(game, first):
+    tile_size = first.tile_size
+
+    blast = game.explosion_pool.acquire(first.x, first.y, tile_size=tile_size)
+    hit_items = {}      # (x, y) → None (dict: orden de inserción estable)
+    hit_blocks = {}
+
+    pending = [first]
+    first.exploded = True
+    while pending:
+        bomb = pending.pop()
+        bomb.dead = True
+
+        # Deja de ocupar su tile (ya no bloquea ni encadena)
+        game.remove_bomb(bomb)
+        bomb.owner.bombs_active -= 1
+
+        # Limpia la bomba del mapa (para que no sea un obstáculo)
+        game.map.set(bomb.x, bomb.y, Tile.EMPTY)
+
+        # Rayos recortados por los muros sólidos (core/blast.py)
+        arms = []
+        for dx, dy, reach in game.blast.rays(bomb.x, bomb.y, bomb.power):
+            length = 0
+            for r in range(1, reach + 1):
+                tile = (bomb.x + dx * r, bomb.y + dy * r)
+                length = r
+
+                # Otra bomba en el camino → se suma a la cadena
+                other = game.occupancy.bomb_at(*tile)
+                if other is not None and not other.exploded:
+                    other.exploded = True
+                    pending.append(other)
+
+                # Ítems y bloques frenan el rayo
+                cell = game.map.get(*tile)
+                if cell == Tile.ITEM:
+                    hit_items[tile] = None
+                    break
+                if cell == Tile.BLOCK:
+                    hit_blocks[tile] = None
+                    break
+            arms.append((dx, dy, length))
+
+        blast.add_arms(bomb.x, bomb.y, arms)
+
+    # ------------------------------------------------------
+    # Aplicar resultados
+    # ------------------------------------------------------
+    game.add_explosion(blast)
+
+    # Ítems alcanzados: se destruyen, excepto la llave
+    for x, y in hit_items:
+        item = game.items.get(x, y)
+        if item is not None and item.item_type != "KEY":
+            game.remove_item(item)
+        game.map.set(x, y, Tile.EMPTY)
+
+    # Bloques alcanzados: se destruyen y sueltan su ítem oculto
+    for x, y in hit_blocks:
+        block = game.remove_block(x, y)
+        if block is not None and getattr(block, "item_hidden", None):
+            game.items.add(
+                game.item_pool.acquire(x, y, block.item_hidden, tile_size=tile_size)
+            )
+        game.map.set(x, y, Tile.EMPTY)
+
+        # El bloque ya no existe → redibujar su tile en el fondo
+        game.invalidate_tile(x, y)
@@ -0,0 +1,116 @@
+from array import array
+
+# ==========================================================
+#  COMPONENTES CONECTADOS (ALCANZABILIDAD)
+# ----------------------------------------------------------
+#  Etiqueta los tiles libres para un enemigo (ni muro, ni
+#  bloque, ni bomba) en regiones conectadas, con union-find.
+#
+#  "¿Puede este enemigo llegar al jugador?" se responde en
+#  O(1) comparando regiones, y la búsqueda de camino se omite
+#  cuando es imposible (jugador encerrado).
+#
+#  Mantenimiento:
+#    - bloque destruido → su tile se une a los vecinos libres
+#      (incremental: las regiones sólo pueden fusionarse)
+#    - bomba colocada o quitada → recálculo completo en la
+#      próxima consulta (una bomba puede partir una región)
+# ==========================================================
+class Reachability:
+    def __init__(self, bits):
+        self.bits = bits
+        self.parent = array("i", range(bits.size))
+        self._stale = True
+
+        # Cantidad de recálculos completos (para depuración)
+        self.rebuilds = 0
+
+    # ------------------------------------------------------
+    # UNION-FIND
+    # ------------------------------------------------------
+    def _find(self, i):
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]   # compresión por mitades
+            i = parent[i]
+        return i
+
+    def _union(self, a, b):
+        ra = self._find(a)
+        rb = self._find(b)
+        if ra != rb:
+            self.parent[rb] = ra
+
+    def _free(self):
+        bits = self.bits
+        return bits.board & ~bits.blocked_for_enemies()
+
+    def _union_pairs(self, pairs, step):
+        """Une cada tile de la máscara `pairs` con el tile i + step."""
+        while pairs:
+            low = pairs & -pairs
+            i = low.bit_length() - 1
+            self._union(i, i + step)
+            pairs ^= low
+
+    def _rebuild(self):
+        self.rebuilds += 1
+        self.parent = array("i", range(self.bits.size))
+
+        # Pares de tiles libres adyacentes, calculados con bits:
+        # horizontales (i, i+1) y verticales (i, i+stride)
+        free = self._free()
+        stride = self.bits.stride
+        self._union_pairs(free & (free >> 1), 1)
+        self._union_pairs(free & (free >> stride), stride)
+        self._stale = False
+
+    # ------------------------------------------------------
+    # MANTENIMIENTO
+    # ------------------------------------------------------
+    def invalidate(self):
+        """La disposición cambió de forma no incremental (bombas)."""
+        self._stale = True
+
+    def open_tile(self, x, y):
+        """Un tile pasó a estar libre (bloque destruido)."""
+        if self._stale:
+            return
+        bits = self.bits
+        i = bits.index(x, y)
+        free = self._free()
+        if not (free >> i) & 1:
+            return
+        for step in (-bits.stride, bits.stride, -1, 1):
+            if (free >> (i + step)) & 1:
+                self._union(i, i + step)
+
+    # ------------------------------------------------------
+    # CONSULTA
+    # ------------------------------------------------------
+    def reachable(self, start, goal):
+        """
+        True si un enemigo en `start` puede llegar a `goal`.
+        El tile de partida puede estar ocupado (p. ej. por una
+        bomba recién puesta): basta con que un vecino libre
+        esté en la región del objetivo.
+        """
+        if self._stale:
+            self._rebuild()
+        if start == goal:
+            return True
+
+        bits = self.bits
+        free = self._free()
+        g = bits.index(*goal)
+        if not (free >> g) & 1:
+            return False
+
+        root = self._find(g)
+        s = bits.index(*start)
+        if (free >> s) & 1:
+            return self._find(s) == root
+        for step in (-bits.stride, bits.stride, -1, 1):
+            if (free >> (s + step)) & 1 and self._find(s + step) == root:
+                return True
+        return False
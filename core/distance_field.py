@@ -0,0 +1,80 @@
+from array import array
+
+# ==========================================================
+#  CAMPO DE DISTANCIAS HACIA EL JUGADOR
+# ----------------------------------------------------------
+#  En lugar de que cada enemigo haga su propio BFS hasta el
+#  jugador, se hace UN solo BFS inverso desde el tile del
+#  jugador: dist[i] = pasos desde el tile i hasta él.
+#
+#  Cada enemigo elige su siguiente paso en O(1): el vecino
+#  libre con menor distancia.
+#
+#  Se recalcula sólo si el jugador cambió de tile o si cambió
+#  la disposición de bloques/bombas (LevelBits.version).
+# ==========================================================
+
+# Orden de preferencia ante empates (igual que Enemy.find_path)
+NEIGHBOR_ORDER = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+
+class DistanceField:
+    def __init__(self, bits):
+        self.bits = bits
+        self._blank = array("i", [-1]) * bits.size
+        self.dist = array("i", self._blank)
+        self._key = None
+
+        # Cantidad de BFS realizados (para depuración)
+        self.rebuilds = 0
+
+    def _refresh(self, goal):
+        key = (goal, self.bits.version)
+        if key == self._key:
+            return
+        self._key = key
+        self.rebuilds += 1
+
+        bits = self.bits
+        dist = self.dist
+        dist[:] = self._blank
+
+        # Mismos obstáculos que Enemy.is_blocked; si el jugador está
+        # sobre una bomba, nadie puede llegar hasta él
+        free = bits.board & ~bits.blocked_for_enemies()
+        frontier = bits.bit(*goal) & free
+        seen = frontier
+        d = 0
+        while frontier:
+            # Recorrer los bits de la capa actual
+            layer = frontier
+            while layer:
+                low = layer & -layer
+                dist[low.bit_length() - 1] = d
+                layer ^= low
+
+            frontier = bits.neighbors(frontier) & free & ~seen
+            seen |= frontier
+            d += 1
+
+    def next_step(self, x, y, goal):
+        """
+        Tile vecino de (x, y) que más acerca a `goal`, o None si
+        ya está en goal o no hay camino.
+        """
+        self._refresh(goal)
+        if (x, y) == goal:
+            return None
+
+        dist = self.dist
+        stride = self.bits.stride
+        base = (y + self.bits.pad) * stride + x + self.bits.pad
+
+        best = None
+        best_d = -1
+        for dx, dy in NEIGHBOR_ORDER:
+            d = dist[base + dy * stride + dx]
+            if d >= 0 and (best is None or d < best_d):
+                best = (x + dx, y + dy)
+                best_d = d
+        return best
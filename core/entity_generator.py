@@ -2,6 +2,7 @@ from entities.player import Player
 from entities.enemy import Enemy
 from entities.blocks import DestructibleBlock, IndestructibleBlock
 from entities.portal import Portal
+from core.tilemap import Tile
 import random
 
 # ----------------------------------------------------------
@@ -14,9 +15,9 @@ DROP_RATE = 0.15
 
 
 # ==========================================================
-# generate_entities(game, matrix)
+# generate_entities(game, tilemap)
 # ----------------------------------------------------------
-# Lee la matriz del nivel (mapa) y crea las entidades:
+# Lee el mapa del nivel y crea las entidades:
 #   - S → Bloque indestructible
 #   - B → Bloque destruible (posible ítem oculto)
 #   - P → Jugador
@@ -29,9 +30,9 @@ DROP_RATE = 0.15
 #
 # Parámetros:
 #   game    → instancia de GamePlayScreen que almacenará las entidades
-#   matrix  → mapa del nivel como matriz de caracteres
+#   tilemap → mapa del nivel (core.tilemap.TileMap)
 # ==========================================================
-def generate_entities(game, matrix):
+def generate_entities(game, tilemap):
     # Lista para rastrear todos los bloques destruibles,
     # útil para asignar la llave si no aparece aleatoriamente.
     destructible_blocks = []
@@ -40,63 +41,63 @@ def generate_entities(game, matrix):
     key_generated = False
 
     # ------------------------------------------------------
-    # Recorrer toda la matriz del nivel
+    # Recorrer todo el mapa del nivel
     # ------------------------------------------------------
-    for y, row in enumerate(matrix):
-        for x, char in enumerate(row):
-
-            # ----------------------------------------------
-            # 'S' → bloque sólido indestructible
-            # ----------------------------------------------
-            if char == "S":
-                game.blocks.append(IndestructibleBlock(x, y))
-
-            # ----------------------------------------------
-            # 'B' → bloque destructible (puede tener ítem oculto)
-            # ----------------------------------------------
-            elif char == "B":
-                hidden_item = None
-
-                # Intento aleatorio de generar un ítem
-                if random.random() < DROP_RATE:
-                    hidden_item = random.choice(POWERUP_TYPES)
-
-                    # Si salió una llave → marcar que ya existe
-                    if hidden_item == "KEY":
-                        key_generated = True
-                        # Remover KEY para evitar más llaves aleatorias
-                        POWERUP_TYPES.remove("KEY")
-
-                # Crear el bloque destruible, asignando ítem o None
-                block = DestructibleBlock(x, y, item_hidden=hidden_item)
-                game.blocks.append(block)
-
-                # Registrar este bloque para usarlo después si falta la llave
-                destructible_blocks.append(block)
-
-            # ----------------------------------------------
-            # 'P' → jugador inicial
-            # ----------------------------------------------
-            elif char == "P":
-                game.player = Player(x, y)
-
-            # ----------------------------------------------
-            # 'E' → enemigo
-            # ----------------------------------------------
-            elif char == "E":
-                en = Enemy(x, y, name="Ballom")
-
-                # Aplicar modificaciones por dificultad:
-                en.move_duration *= game.enemy_speed_mod
-                en.ai_type = game.enemy_ai_type
-
-                game.enemies.append(en)
-
-            # ----------------------------------------------
-            # 'O' → portal (la puerta)
-            # ----------------------------------------------
-            elif char == "O":
-                game.portal = Portal(x, y)
+    for x, y, tile in tilemap.cells():
+
+        # ----------------------------------------------
+        # 'S' → bloque sólido indestructible
+        # ----------------------------------------------
+        if tile == Tile.SOLID:
+            game.blocks.add(IndestructibleBlock(x, y))
+
+        # ----------------------------------------------
+        # 'B' → bloque destructible (puede tener ítem oculto)
+        # ----------------------------------------------
+        elif tile == Tile.BLOCK:
+            hidden_item = None
+
+            # Intento aleatorio de generar un ítem
+            if random.random() < DROP_RATE:
+                hidden_item = random.choice(POWERUP_TYPES)
+
+                # Si salió una llave → marcar que ya existe
+                if hidden_item == "KEY":
+                    key_generated = True
+                    # Remover KEY para evitar más llaves aleatorias
+                    POWERUP_TYPES.remove("KEY")
+
+            # Crear el bloque destruible, asignando ítem o None
+            block = DestructibleBlock(x, y, item_hidden=hidden_item)
+            game.blocks.add(block)
+
+            # Registrar este bloque para usarlo después si falta la llave
+            destructible_blocks.append(block)
+
+        # ----------------------------------------------
+        # 'P' → jugador inicial
+        # ----------------------------------------------
+        elif tile == Tile.PLAYER:
+            game.player = Player(x, y)
+
+        # ----------------------------------------------
+        # 'E' → enemigo
+        # ----------------------------------------------
+        elif tile == Tile.ENEMY:
+            en = Enemy(x, y, name="Ballom")
+
+            # Aplicar modificaciones por dificultad:
+            en.move_duration *= game.enemy_speed_mod
+            en.ai_type = game.enemy_ai_type
+
+            game.enemies.append(en)
+            game.enemy_hash.place(en, *en.hitbox())
+
+        # ----------------------------------------------
+        # 'O' → portal (la puerta)
+        # ----------------------------------------------
+        elif tile == Tile.PORTAL:
+            game.portal = Portal(x, y)
 
     # ======================================================
     # GARANTIZAR QUE SIEMPRE EXISTA UNA LLAVE
@@ -0,0 +1,82 @@
+import string
+import pygame
+from core.atlas import TextureAtlas
+
+# ==========================================================
+#  ATLAS DE GLIFOS PARA CONTADORES DEL HUD
+# ----------------------------------------------------------
+#  El puntaje cambia cada pocos milisegundos: aunque el texto
+#  se cachee (render_text), cada valor nuevo vuelve a pasar
+#  por el rasterizador TrueType.
+#
+#  Aquí cada carácter se renderiza UNA vez al inicio y se
+#  guarda en un atlas. Para dibujar un texto se arma la lista
+#  (atlas, posición, región) de cada letra y se envía en una
+#  sola llamada a Surface.blits().
+#
+#  Pensado para fuentes de ancho fijo / pixel-art (la del
+#  juego): no se aplica kerning entre letras.
+# ==========================================================
+
+# Dígitos + mayúsculas + signos usados en el HUD
+HUD_CHARSET = string.digits + string.ascii_uppercase + " :/-%"
+
+
+class GlyphAtlas:
+    def __init__(self, font, color, charset=HUD_CHARSET):
+        self.font = font
+        self.color = color
+        self.height = font.get_linesize()
+
+        glyphs = {ch: font.render(ch, True, color) for ch in charset}
+        self._atlas = TextureAtlas()
+        self._atlas.pack(glyphs)
+        self.surface = self._atlas.surface
+
+        # carácter → (región en el atlas, avance horizontal)
+        self.regions = self._atlas.regions
+        self.advance = {ch: g.get_width() for ch, g in glyphs.items()}
+
+        # Glifos fuera del charset: se renderizan al primer uso
+        self._extra = {}
+
+    def _extra_glyph(self, ch):
+        g = self._extra.get(ch)
+        if g is None:
+            g = self.font.render(ch, True, self.color)
+            self._extra[ch] = g
+            self.advance[ch] = g.get_width()
+        return g
+
+    # ------------------------------------------------------
+    # MEDIDAS
+    # ------------------------------------------------------
+    def size(self, text):
+        """Ancho y alto del texto (como font.size)."""
+        width = 0
+        for ch in text:
+            if ch not in self.advance:
+                self._extra_glyph(ch)
+            width += self.advance[ch]
+        return width, self.height
+
+    # ------------------------------------------------------
+    # DIBUJO
+    # ------------------------------------------------------
+    def draw(self, surface, text, pos):
+        """
+        Dibuja `text` con su esquina superior izquierda en `pos`.
+        Devuelve el pygame.Rect ocupado.
+        """
+        x, y = pos
+        batch = []
+        for ch in text:
+            region = self.regions.get(ch)
+            if region is not None:
+                batch.append((self.surface, (x, y), region))
+            else:
+                batch.append((self._extra_glyph(ch), (x, y)))
+            x += self.advance[ch]
+
+        surface.blits(batch, False)
+        return pygame.Rect(pos[0], pos[1], x - pos[0], self.height)
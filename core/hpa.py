@@ -0,0 +1,321 @@
+import heapq
+from collections import deque
+from core.tilemap import Tile
+
+# ==========================================================
+#  PATHFINDING JERÁRQUICO (HPA*) PARA MAPAS GRANDES
+# ----------------------------------------------------------
+#  El mapa se divide en clusters de N×N tiles. En el borde
+#  entre dos clusters vecinos, cada tramo continuo de tiles
+#  transitables de ambos lados es una "entrada" (se usa su
+#  tile central). Con eso se arma un grafo abstracto:
+#
+#    - aristas entre clusters → las dos celdas de una entrada
+#      (costo 1)
+#    - aristas internas       → distancia (BFS dentro del
+#      cluster) entre entradas del mismo cluster
+#
+#  Una búsqueda larga se planea sobre ese grafo (pocos nodos)
+#  y luego se refina tramo a tramo con A* local.
+#
+#  El grafo sólo considera muros y bloques (lo estático). Las
+#  bombas las respeta el refinamiento; si un tramo queda
+#  cortado se recurre a la búsqueda A* completa.
+#
+#  Cuando una explosión destruye un bloque (open_tile) sólo se
+#  rehacen las entradas de los bordes de su cluster y las
+#  aristas internas del cluster y sus vecinos.
+# ==========================================================
+class HierarchicalPathfinder:
+    def __init__(self, tilemap, bits, astar, cluster_size=10):
+        self.bits = bits
+        self.astar = astar
+        self.size = cluster_size
+        self.width = tilemap.width
+        self.height = tilemap.height
+        self.stride = tilemap.stride
+        self.pad = tilemap.pad
+
+        # Muros y bloques, un byte por tile (mismo orden que TileMap.data)
+        self.walls = bytearray(
+            1 if t in (Tile.SOLID, Tile.BLOCK) else 0 for t in tilemap.data
+        )
+
+        self.clusters_w = (self.width + cluster_size - 1) // cluster_size
+        self.clusters_h = (self.height + cluster_size - 1) // cluster_size
+
+        # (cluster_a, cluster_b) → [(nodo_a, nodo_b), ...]
+        self.borders = {}
+        # nodo → set de nodos en el cluster vecino (aristas de costo 1)
+        self.links = {}
+        # cluster → {nodo: {nodo: costo}} (aristas internas)
+        self.intra = {}
+
+        # Búsquedas resueltas con el grafo / con A* completo (depuración)
+        self.abstract_searches = 0
+        self.fallbacks = 0
+
+        for c in self._clusters():
+            for other in self._forward_neighbors(c):
+                self._build_border(c, other)
+        for c in self._clusters():
+            self._build_intra(c)
+
+    # ------------------------------------------------------
+    # GEOMETRÍA DE CLUSTERS
+    # ------------------------------------------------------
+    def _clusters(self):
+        return [(cx, cy) for cy in range(self.clusters_h) for cx in range(self.clusters_w)]
+
+    def _forward_neighbors(self, c):
+        """Vecinos de la derecha y de abajo (cada borde una sola vez)."""
+        cx, cy = c
+        if cx + 1 < self.clusters_w:
+            yield (cx + 1, cy)
+        if cy + 1 < self.clusters_h:
+            yield (cx, cy + 1)
+
+    def _neighbors(self, c):
+        cx, cy = c
+        for ox, oy in ((cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1)):
+            if 0 <= ox < self.clusters_w and 0 <= oy < self.clusters_h:
+                yield (ox, oy)
+
+    def _bounds(self, c):
+        """(x0, y0, x1, y1) del cluster, con x1/y1 exclusivos."""
+        n = self.size
+        x0, y0 = c[0] * n, c[1] * n
+        return x0, y0, min(x0 + n, self.width), min(y0 + n, self.height)
+
+    @staticmethod
+    def _border_key(a, b):
+        """Clave del borde entre a y b: el de la izquierda/arriba primero."""
+        return (a, b) if (a[1], a[0]) < (b[1], b[0]) else (b, a)
+
+    def cluster_of(self, index):
+        y, x = divmod(index, self.stride)
+        return ((x - self.pad) // self.size, (y - self.pad) // self.size)
+
+    def _index(self, x, y):
+        return (y + self.pad) * self.stride + x + self.pad
+
+    # ------------------------------------------------------
+    # ENTRADAS ENTRE CLUSTERS
+    # ------------------------------------------------------
+    def _build_border(self, a, b):
+        """Entradas en el borde entre a y b (b a la derecha o abajo de a)."""
+        ax0, ay0, ax1, ay1 = self._bounds(a)
+        if b[0] != a[0]:
+            # Borde vertical: columna ax1-1 (a) | ax1 (b)
+            pairs = [(self._index(ax1 - 1, y), self._index(ax1, y)) for y in range(ay0, ay1)]
+        else:
+            # Borde horizontal: fila ay1-1 (a) / ay1 (b)
+            pairs = [(self._index(x, ay1 - 1), self._index(x, ay1)) for x in range(ax0, ax1)]
+
+        walls = self.walls
+        entrances = []
+        run = []
+        for pa, pb in pairs + [(None, None)]:
+            if pa is not None and not walls[pa] and not walls[pb]:
+                run.append((pa, pb))
+                continue
+            if run:
+                entrances.append(run[len(run) // 2])   # tile central del tramo
+                run = []
+
+        self.borders[(a, b)] = entrances
+        for na, nb in entrances:
+            self.links.setdefault(na, set()).add(nb)
+            self.links.setdefault(nb, set()).add(na)
+
+    def _clear_border(self, a, b):
+        for na, nb in self.borders.pop((a, b), ()):
+            for n, other in ((na, nb), (nb, na)):
+                group = self.links.get(n)
+                if group is not None:
+                    group.discard(other)
+                    if not group:
+                        del self.links[n]
+
+    def _nodes(self, c):
+        """Nodos abstractos (celdas de entrada) dentro del cluster c."""
+        nodes = set()
+        for other in self._neighbors(c):
+            key = self._border_key(c, other)
+            for na, nb in self.borders.get(key, ()):
+                nodes.add(na if key[0] == c else nb)
+        return nodes
+
+    # ------------------------------------------------------
+    # ARISTAS INTERNAS
+    # ------------------------------------------------------
+    def _local_distances(self, c, source):
+        """BFS limitado al cluster c (sólo muros/bloques): tile → distancia."""
+        x0, y0, x1, y1 = self._bounds(c)
+        walls = self.walls
+        stride = self.stride
+        pad = self.pad
+        dist = {source: 0}
+        queue = deque([source])
+        while queue:
+            i = queue.popleft()
+            d = dist[i] + 1
+            for step in (-stride, stride, -1, 1):
+                n = i + step
+                if n in dist or walls[n]:
+                    continue
+                y, x = divmod(n, stride)
+                if not (x0 <= x - pad < x1 and y0 <= y - pad < y1):
+                    continue
+                dist[n] = d
+                queue.append(n)
+        return dist
+
+    def _build_intra(self, c):
+        nodes = self._nodes(c)
+        edges = {n: {} for n in nodes}
+        for n in nodes:
+            dist = self._local_distances(c, n)
+            for m in nodes:
+                if m != n and m in dist:
+                    edges[n][m] = dist[m]
+        self.intra[c] = edges
+
+    # ------------------------------------------------------
+    # ACTUALIZACIÓN INCREMENTAL
+    # ------------------------------------------------------
+    def open_tile(self, x, y):
+        """Un bloque fue destruido: rehacer sólo su zona del grafo."""
+        i = self._index(x, y)
+        if not self.walls[i]:
+            return
+        self.walls[i] = 0
+
+        # Sólo los bordes sobre los que está el tile pueden cambiar
+        # de entradas; si cambian, también el cluster vecino
+        c = self.cluster_of(i)
+        x0, y0, x1, y1 = self._bounds(c)
+        for other in self._neighbors(c):
+            if ((other[0] < c[0] and x != x0) or (other[0] > c[0] and x != x1 - 1)
+                    or (other[1] < c[1] and y != y0) or (other[1] > c[1] and y != y1 - 1)):
+                continue
+            key = self._border_key(c, other)
+            old = self.borders.get(key)
+            self._clear_border(*key)
+            self._build_border(*key)
+            if self.borders[key] != old:
+                self._build_intra(other)
+
+        # Dentro del cluster pueden acortarse las distancias
+        self._build_intra(c)
+
+    # ------------------------------------------------------
+    # BÚSQUEDA
+    # ------------------------------------------------------
+    def find_path(self, start, goal, budget=None):
+        """
+        Igual que AStar.find_path: [] si start == goal, None si no
+        hay camino. Dentro de un mismo cluster usa A* directo.
+        """
+        bits = self.bits
+        s = bits.index(*start)
+        t = bits.index(*goal)
+        if s == t:
+            return []
+        if bits.enemy_blocked[t]:
+            return None
+
+        cs = self.cluster_of(s)
+        ct = self.cluster_of(t)
+        if cs == ct:
+            return self.astar.find_path(start, goal, budget)
+
+        # Sin ruta en el grafo no hay camino posible (las bombas
+        # sólo pueden quitar caminos, nunca agregarlos)
+        route = self._abstract_route(s, t, cs, ct)
+        if route is None:
+            return None
+
+        path = self._refine(route)
+        if path is not None:
+            self.abstract_searches += 1
+            return path
+
+        # Tramo cortado por una bomba → A* completo
+        self.fallbacks += 1
+        return self.astar.find_path(start, goal, budget)
+
+    def _abstract_route(self, s, t, cs, ct):
+        """A* sobre el grafo de entradas; devuelve la lista de nodos."""
+        start_edges = self._local_distances(cs, s)
+        start_edges = {n: start_edges[n] for n in self.intra[cs] if n in start_edges}
+        goal_dist = self._local_distances(ct, t)
+        goal_edges = {n: goal_dist[n] for n in self.intra[ct] if n in goal_dist}
+        if not start_edges or not goal_edges:
+            return None
+
+        stride = self.stride
+        ty, tx = divmod(t, stride)
+
+        def h(i):
+            y, x = divmod(i, stride)
+            return abs(x - tx) + abs(y - ty)
+
+        # (f, h, orden, nodo): a igual f, primero el más cercano al objetivo
+        g = {s: 0}
+        parent = {s: None}
+        closed = set()
+        heap = [(h(s), h(s), 0, s)]
+        counter = 1
+        while heap:
+            _, _, _, n = heapq.heappop(heap)
+            if n in closed:
+                continue
+            closed.add(n)
+            if n == t:
+                route = []
+                while n is not None:
+                    route.append(n)
+                    n = parent[n]
+                route.reverse()
+                return route
+
+            if n == s:
+                edges = list(start_edges.items())
+            else:
+                edges = list(self.intra[self.cluster_of(n)].get(n, {}).items())
+            # (el inicio también puede ser una celda de entrada)
+            edges += [(m, 1) for m in self.links.get(n, ())]
+            if n in goal_edges:
+                edges.append((t, goal_edges[n]))
+
+            for m, cost in edges:
+                gm = g[n] + cost
+                if m in closed or gm >= g.get(m, gm + 1):
+                    continue
+                g[m] = gm
+                parent[m] = n
+                hm = h(m)
+                heapq.heappush(heap, (gm + hm, hm, counter, m))
+                counter += 1
+        return None
+
+    def _refine(self, route):
+        """Convierte la ruta abstracta en tiles con A* local por tramo."""
+        coords = self.bits.coords
+        blocked = self.bits.enemy_blocked
+        path = []
+        for a, b in zip(route, route[1:]):
+            if a == b:
+                continue
+            if b in self.links.get(a, ()):
+                # Cruce de borde: tiles vecinos
+                if blocked[b]:
+                    return None
+                path.append(coords(b))
+                continue
+            segment = self.astar.find_path(coords(a), coords(b))
+            if segment is None:
+                return None
+            path += segment
+        return path
@@ -0,0 +1,50 @@
+# ==========================================================
+#  ÍNDICE DE OCUPACIÓN POR TILE
+# ----------------------------------------------------------
+#  Responde en O(1) "¿qué hay en la celda (x, y)?" para las
+#  entidades que se mueven o aparecen durante la partida:
+#    - bombas       → (x, y) → Bomb
+#    - explosiones  → (x, y) → cantidad de explosiones activas
+#
+#  Se mantiene de forma incremental: quien crea o elimina una
+#  entidad avisa aquí (ver GamePlayScreen.add_bomb/remove_bomb
+#  y add_explosion). Así ninguna consulta de colisión recorre
+#  las listas del juego.
+#
+#  Bloques e ítems no están aquí: game.blocks y game.items ya
+#  son registros por tile (core/registry.py). Los enemigos se
+#  mueven en píxeles: están en game.enemy_hash (core/spatial.py).
+# ==========================================================
+class OccupancyGrid:
+    def __init__(self):
+        self.bombs = {}
+        self.explosions = {}
+
+    # ------------------------------------------------------
+    # BOMBAS (como máximo una por tile)
+    # ------------------------------------------------------
+    def add_bomb(self, bomb):
+        self.bombs[(bomb.x, bomb.y)] = bomb
+
+    def remove_bomb(self, bomb):
+        if self.bombs.get((bomb.x, bomb.y)) is bomb:
+            del self.bombs[(bomb.x, bomb.y)]
+
+    def bomb_at(self, x, y):
+        return self.bombs.get((x, y))
+
+    # ------------------------------------------------------
+    # EXPLOSIONES (contador: pueden superponerse)
+    # ------------------------------------------------------
+    def add_explosion(self, x, y):
+        self.explosions[(x, y)] = self.explosions.get((x, y), 0) + 1
+
+    def remove_explosion(self, x, y):
+        n = self.explosions.get((x, y), 0) - 1
+        if n > 0:
+            self.explosions[(x, y)] = n
+        else:
+            self.explosions.pop((x, y), None)
+
+    def has_explosion(self, x, y):
+        return (x, y) in self.explosions
@@ -0,0 +1,47 @@
+# ==========================================================
+#  POOLS DE ENTIDADES
+# ----------------------------------------------------------
+#  Bombas, explosiones e ítems aparecen y desaparecen todo el
+#  tiempo. En lugar de crear un objeto nuevo cada vez, las
+#  instancias muertas vuelven a un pool y se reutilizan con
+#  reset(), que recibe los mismos argumentos que __init__.
+#
+#  compact() filtra una lista de entidades activas en el lugar
+#  (sin crear otra lista) y devuelve las muertas a su pool.
+# ==========================================================
+class Pool:
+    def __init__(self, cls):
+        self.cls = cls
+        self._free = []
+
+    def acquire(self, *args, **kwargs):
+        """Instancia lista para usar: reciclada si hay alguna libre."""
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args, **kwargs)
+            return obj
+        return self.cls(*args, **kwargs)
+
+    def release(self, obj):
+        """Devuelve una instancia que ya no está en juego."""
+        self._free.append(obj)
+
+    def __len__(self):
+        """Cantidad de instancias libres."""
+        return len(self._free)
+
+
+def compact(entities, pool=None):
+    """
+    Quita de `entities` (en el lugar) las entidades con dead=True,
+    conservando el orden, y las devuelve a `pool` si se indica.
+    """
+    keep = 0
+    for e in entities:
+        if e.dead:
+            if pool is not None:
+                pool.release(e)
+        else:
+            entities[keep] = e
+            keep += 1
+    del entities[keep:]
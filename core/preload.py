@@ -0,0 +1,203 @@
+from concurrent.futures import ThreadPoolExecutor
+from core import assets
+from core.maps import LEVEL_MAPS
+from core.entity_generator import POWERUP_TYPES
+from entities.blocks import DestructibleBlock, IndestructibleBlock
+from entities.bomb import Bomb
+from entities.enemy import Enemy
+from entities.items import Item
+from entities.player import Player
+from entities.portal import Portal
+
+# ==========================================================
+#  MANIFIESTO DE PRECARGA POR NIVEL
+# ----------------------------------------------------------
+#  Lista todo lo que una partida puede llegar a dibujar para
+#  cargarlo ANTES del primer frame. Así, colocar una bomba o
+#  soltar un ítem en mitad de la partida no lee de disco.
+#
+#  Cada entrada es una tupla:
+#    ("image", ruta, tamaño)
+#    ("sequence", patrón, tamaño, índice_inicial)
+# ==========================================================
+
+DIRECTIONS = ["down", "up", "left", "right"]
+
+
+def _sprite_set(pattern, size):
+    return [
+        ("image", pattern.format(direction=d, index=i), size)
+        for d in DIRECTIONS for i in range(4)
+    ]
+
+
+# ==========================================================
+# build_manifest(matrix, tile_size)
+# ----------------------------------------------------------
+# matrix → mapa del nivel (filas de caracteres)
+# Devuelve la lista (sin duplicados) de recursos necesarios.
+# ==========================================================
+def build_manifest(matrix, tile_size=32, floor_path=None):
+    size = (tile_size, tile_size)
+    chars = {c for row in matrix for c in row}
+    manifest = []
+
+    if floor_path:
+        manifest.append(("image", floor_path, size))
+
+    if "S" in chars:
+        manifest.append(("image", IndestructibleBlock.IMAGE_PATH, size))
+    if "B" in chars:
+        manifest.append(("image", DestructibleBlock.IMAGE_PATH, size))
+    if "O" in chars:
+        manifest.append(("image", Portal.OPEN_PATH, size))
+        manifest.append(("image", Portal.CLOSED_PATH, size))
+    if "P" in chars:
+        manifest += _sprite_set(Player.SPRITE_PATTERN, size)
+        # El jugador siempre puede colocar bombas
+        manifest.append(("sequence", Bomb.FRAME_PATTERN, size, 0))
+    if "E" in chars:
+        manifest += _sprite_set(Enemy.SPRITE_PATTERN, size)
+
+    # Cualquier bloque destructible puede soltar cualquier ítem.
+    # KEY se añade aparte: generate_entities la quita de
+    # POWERUP_TYPES tras salir, pero siempre existe una llave.
+    if "B" in chars:
+        for item_type in dict.fromkeys(POWERUP_TYPES + ["KEY"]):
+            manifest.append(("sequence", Item.frame_pattern(item_type), size, 1))
+
+    return list(dict.fromkeys(manifest))
+
+
+# ==========================================================
+# warm(manifest)
+# ----------------------------------------------------------
+# Carga en la caché todo lo listado. Los archivos faltantes
+# se ignoran: la entidad usará su propio fallback.
+# ==========================================================
+def warm(manifest):
+    for entry in manifest:
+        try:
+            if entry[0] == "image":
+                assets.load_image(entry[1], entry[2])
+            else:
+                assets.load_sequence(entry[1], entry[2], entry[3])
+        except Exception as e:
+            print(f"No se pudo precargar {entry[1]}: {e}")
+
+
+# ==========================================================
+# full_manifest(tile_size, first_level)
+# ----------------------------------------------------------
+# Manifiesto de todos los niveles. Si se indica first_level,
+# sus recursos van primero (se cargan antes).
+# ==========================================================
+def full_manifest(tile_size=32, floor_path=None, first_level=None):
+    manifest = []
+    if first_level is not None:
+        manifest += build_manifest(LEVEL_MAPS[first_level], tile_size, floor_path)
+
+    rows = [row for level in LEVEL_MAPS for row in level]
+    manifest += build_manifest(rows, tile_size, floor_path)
+    return list(dict.fromkeys(manifest))
+
+
+# ==========================================================
+#  PRECARGA EN SEGUNDO PLANO
+# ----------------------------------------------------------
+#  Mientras se muestran los menús, un pool de hilos decodifica
+#  las imágenes del manifiesto (la decodificación de pygame
+#  libera el GIL). El hilo principal, en poll(), hace la parte
+#  que depende de la pantalla (convert_alpha + scale) y las
+#  guarda en la caché, unas pocas por frame.
+#
+#  Cuando termina se empaqueta el atlas y entrar a un nivel ya
+#  no carga nada: warm() encuentra todo en la caché.
+# ==========================================================
+class AsyncPreloader:
+    def __init__(self, manifest, workers=2, per_frame=16):
+        self.manifest = manifest
+        self.per_frame = per_frame    # imágenes a terminar por frame
+        self.total = len(manifest)
+        self.loaded = 0
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._futures = [
+            (entry, self._executor.submit(self._decode, entry))
+            for entry in manifest
+        ]
+        self._packed = False
+
+    # ------------------------------------------------------
+    # HILO DE TRABAJO: sólo decodificación
+    # ------------------------------------------------------
+    @staticmethod
+    def _decode(entry):
+        """Devuelve [(ruta, surface, lista), ...] para la entrada."""
+        size = entry[2]
+        if entry[0] == "image":
+            paths = [entry[1]]
+        else:
+            paths = assets.sequence_paths(entry[1], size, entry[3])
+
+        decoded = []
+        for path in paths:
+            if assets.is_cached(path, size):
+                decoded.append((path, None, True))
+            else:
+                decoded.append((path, *assets.decode_image(path, size)))
+        return decoded
+
+    # ------------------------------------------------------
+    # HILO PRINCIPAL
+    # ------------------------------------------------------
+    def _finish(self, entry, future):
+        size = entry[2]
+        try:
+            decoded = future.result()
+        except Exception as e:
+            print(f"No se pudo precargar {entry[1]}: {e}")
+            return
+
+        for path, img, ready in decoded:
+            if img is not None:
+                assets.store_image(path, size, img if ready else assets.finish_image(img, size))
+
+        # Las secuencias se arman con las imágenes ya guardadas
+        if entry[0] == "sequence":
+            assets.load_sequence(entry[1], size, entry[3])
+
+    def poll(self, block=False):
+        """
+        Guarda en la caché lo que los hilos ya decodificaron.
+        block=True espera a que termine todo.
+        """
+        budget = self.per_frame
+        while self._futures and (block or budget > 0):
+            entry, future = self._futures[0]
+            if not block and not future.done():
+                break
+            self._futures.pop(0)
+            self._finish(entry, future)
+            self.loaded += 1
+            budget -= 1
+
+        if not self._futures and not self._packed:
+            self._packed = True
+            self._executor.shutdown(wait=False)
+            assets.pack_atlas()
+
+    def finish(self):
+        """Completa la precarga (bloquea sólo si aún no terminó)."""
+        self.poll(block=True)
+
+    def cancel(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def done(self):
+        return self._packed
+
+    @property
+    def progress(self):
+        """Fracción cargada, de 0.0 a 1.0."""
+        return self.loaded / self.total if self.total else 1.0
@@ -0,0 +1,44 @@
+# ==========================================================
+#  REGISTRO DE ENTIDADES POR TILE
+# ----------------------------------------------------------
+#  Contenedor para entidades fijas en la grilla (bloques,
+#  ítems): como máximo una por celda.
+#
+#  - get / remove por coordenada en O(1)
+#  - se recorre como una lista, en orden de inserción
+#    (estable para dibujar), aunque se eliminen elementos
+#
+#  Reemplaza a las listas game.blocks / game.items, que
+#  obligaban a recorrerlas enteras para encontrar un bloque
+#  y a usar list.remove (O(n)) en cada explosión.
+# ==========================================================
+class TileRegistry:
+    def __init__(self, entities=()):
+        # dict conserva el orden de inserción
+        self._by_tile = {}
+        for e in entities:
+            self.add(e)
+
+    def add(self, entity):
+        self._by_tile[(entity.x, entity.y)] = entity
+
+    def get(self, x, y):
+        """Entidad en el tile (x, y), o None."""
+        return self._by_tile.get((x, y))
+
+    def pop(self, x, y):
+        """Quita y devuelve la entidad del tile (x, y), o None."""
+        return self._by_tile.pop((x, y), None)
+
+    def remove(self, entity):
+        if self._by_tile.get((entity.x, entity.y)) is entity:
+            del self._by_tile[(entity.x, entity.y)]
+
+    def __iter__(self):
+        return iter(self._by_tile.values())
+
+    def __len__(self):
+        return len(self._by_tile)
+
+    def __contains__(self, entity):
+        return self._by_tile.get((entity.x, entity.y)) is entity
@@ -0,0 +1,91 @@
+import pygame
+
+# ==========================================================
+#  SPATIAL HASH (GRILLA UNIFORME EN PÍXELES)
+# ----------------------------------------------------------
+#  Jugador y enemigos se mueven con px/py interpolados; las
+#  colisiones por tile truncado (int(x) == en.x) fallan a
+#  mitad de un movimiento. Aquí cada objeto se guarda con su
+#  rectángulo en píxeles, en todas las celdas que toca.
+#
+#  query(rect) sólo revisa los objetos de las celdas que
+#  cubre el rectángulo → el costo no depende de cuántos
+#  enemigos haya en el mapa. Puede llenar una lista del
+#  llamador (`out`) para no crear una por consulta.
+# ==========================================================
+class SpatialHash:
+    def __init__(self, cell_size=32):
+        self.cell_size = cell_size
+        self.buckets = {}   # (cx, cy) → set de objetos
+        self.rects = {}     # objeto → Rect (en píxeles del mapa)
+        self.cells = {}     # objeto → celdas que ocupa
+
+    def _span(self, rect):
+        c = self.cell_size
+        return tuple(
+            (cx, cy)
+            for cy in range(rect.top // c, (rect.bottom - 1) // c + 1)
+            for cx in range(rect.left // c, (rect.right - 1) // c + 1)
+        )
+
+    # ------------------------------------------------------
+    # ALTAS, MOVIMIENTOS Y BAJAS
+    # ------------------------------------------------------
+    def place(self, obj, x, y, w, h):
+        """Agrega el objeto o actualiza su rectángulo."""
+        rect = self.rects.get(obj)
+        if rect is None:
+            rect = self.rects[obj] = pygame.Rect(x, y, w, h)
+            old = ()
+        else:
+            rect.update(x, y, w, h)
+            old = self.cells[obj]
+
+        cells = self._span(rect)
+        if cells == old:
+            return
+
+        for key in old:
+            group = self.buckets[key]
+            group.discard(obj)
+            if not group:
+                del self.buckets[key]
+        for key in cells:
+            self.buckets.setdefault(key, set()).add(obj)
+        self.cells[obj] = cells
+
+    def remove(self, obj):
+        for key in self.cells.pop(obj, ()):
+            group = self.buckets[key]
+            group.discard(obj)
+            if not group:
+                del self.buckets[key]
+        self.rects.pop(obj, None)
+
+    # ------------------------------------------------------
+    # CONSULTAS
+    # ------------------------------------------------------
+    def query(self, rect, out=None):
+        """
+        Objetos cuyo rectángulo se superpone con `rect` (Rect o
+        tupla x, y, w, h). Si se pasa `out`, se vacía y se reutiliza.
+        """
+        x, y, w, h = rect
+        c = self.cell_size
+        found = [] if out is None else out
+        found.clear()
+        for cy in range(y // c, (y + h - 1) // c + 1):
+            for cx in range(x // c, (x + w - 1) // c + 1):
+                group = self.buckets.get((cx, cy))
+                if not group:
+                    continue
+                for obj in group:
+                    if obj not in found and self.rects[obj].colliderect(rect):
+                        found.append(obj)
+        return found
+
+    def __len__(self):
+        return len(self.rects)
+
+    def __contains__(self, obj):
+        return obj in self.rects
@@ -0,0 +1,110 @@
+from enum import IntEnum
+
+# ==========================================================
+#  MAPA COMPACTO DEL NIVEL
+# ----------------------------------------------------------
+#  Antes: lista de listas de strings de 1 carácter.
+#  Ahora: un único bytearray con un byte por tile.
+#
+#  - Los tipos de tile son enteros (Tile), no strings.
+#  - Se agrega un borde de `pad` tiles SÓLIDOS alrededor:
+#    consultar un vecino fuera del mapa devuelve SOLID sin
+#    tener que comprobar límites.
+#  - Las consultas sobre todo el mapa (celdas caminables,
+#    conteos) se resuelven con operaciones de bytes en C.
+# ==========================================================
+class Tile(IntEnum):
+    EMPTY = 0
+    SOLID = 1     # 'S' muro indestructible
+    BLOCK = 2     # 'B' bloque destructible
+    ITEM = 3      # 'I' ítem del mapa
+    PORTAL = 4    # 'O' puerta de salida
+    PLAYER = 5    # 'P' inicio del jugador
+    ENEMY = 6     # 'E' inicio de un enemigo
+
+
+# Carácter del mapa (core/maps.py) → tipo de tile
+CHAR_TO_TILE = {
+    "S": Tile.SOLID,
+    "B": Tile.BLOCK,
+    "I": Tile.ITEM,
+    "O": Tile.PORTAL,
+    "P": Tile.PLAYER,
+    "E": Tile.ENEMY,
+}
+
+# Tiles que bloquean el paso (para consultas de todo el mapa)
+BLOCKING = (Tile.SOLID, Tile.BLOCK)
+
+
+class TileMap:
+    def __init__(self, width, height, pad=1):
+        self.width = width
+        self.height = height
+        self.pad = pad
+        self.stride = width + 2 * pad   # bytes por fila (con borde)
+
+        # Todo SOLID; el interior se llena desde el nivel
+        self.data = bytearray([Tile.SOLID]) * (self.stride * (height + 2 * pad))
+
+    @classmethod
+    def from_rows(cls, rows, pad=1):
+        """Crea el mapa desde las filas de caracteres de LEVEL_MAPS."""
+        tm = cls(max(len(r) for r in rows), len(rows), pad)
+        for y, row in enumerate(rows):
+            for x in range(tm.width):
+                ch = row[x] if x < len(row) else " "
+                tm.set(x, y, CHAR_TO_TILE.get(ch, Tile.EMPTY))
+        return tm
+
+    # ------------------------------------------------------
+    # ACCESO POR TILE
+    # ------------------------------------------------------
+    def index(self, x, y):
+        return (y + self.pad) * self.stride + x + self.pad
+
+    def get(self, x, y):
+        """Tipo de tile en (x, y). Fuera del mapa (dentro del borde) → SOLID."""
+        return self.data[(y + self.pad) * self.stride + x + self.pad]
+
+    def set(self, x, y, tile):
+        self.data[(y + self.pad) * self.stride + x + self.pad] = tile
+
+    def in_bounds(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def cells(self):
+        """Recorre (x, y, tile) de todo el mapa, fila por fila."""
+        for y in range(self.height):
+            base = self.index(0, y)
+            for x in range(self.width):
+                yield x, y, self.data[base + x]
+
+    # ------------------------------------------------------
+    # CONSULTAS DE TODO EL MAPA
+    # ------------------------------------------------------
+    def count(self, tile):
+        """Cantidad de tiles de un tipo (el borde no cuenta como SOLID)."""
+        n = self.data.count(tile)
+        if tile == Tile.SOLID:
+            n -= len(self.data) - self.width * self.height
+        return n
+
+    def walkable_cells(self, blocking=BLOCKING):
+        """
+        Lista de (x, y) que no son de ningún tipo en `blocking`.
+        El filtrado se hace con bytes.translate (en C) y luego
+        sólo se recorren las posiciones resultantes.
+        """
+        table = bytearray(256)
+        for t in blocking:
+            table[t] = 1
+        mask = self.data.translate(table)
+
+        cells = []
+        i = mask.find(0)
+        while i != -1:
+            y, x = divmod(i, self.stride)
+            cells.append((x - self.pad, y - self.pad))
+            i = mask.find(0, i + 1)
+        return cells
@@ -1,4 +1,5 @@
 import pygame
+from collections import OrderedDict
 from config import FONT_PATH
 
 # ==========================================================
@@ -15,6 +16,35 @@ def load_font(size):
         # Si falla, se usa una fuente estándar del sistema
         return pygame.font.SysFont("arial", size)
 
+# ==========================================================
+#  render_text(font, text, antialias, color)
+# ----------------------------------------------------------
+#  Igual que font.render(text, antialias, color), pero
+#  recuerda el resultado. Los textos fijos (títulos, botones)
+#  se rasterizan una sola vez y los del HUD sólo cuando su
+#  valor cambia.
+#
+#  Caché LRU: al superar TEXT_CACHE_SIZE entradas se descarta
+#  la usada hace más tiempo. La Surface devuelta es compartida:
+#  no dibujar sobre ella.
+# ==========================================================
+TEXT_CACHE_SIZE = 256
+_text_cache = OrderedDict()
+
+
+def render_text(font, text, antialias, color):
+    key = (font, text, antialias, color)
+    surf = _text_cache.get(key)
+    if surf is not None:
+        _text_cache.move_to_end(key)
+        return surf
+
+    surf = font.render(text, antialias, color)
+    _text_cache[key] = surf
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return surf
+
 # ==========================================================
 #  play_music(path, current_music)
 # ----------------------------------------------------------
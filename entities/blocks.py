@@ -1,5 +1,5 @@
-import pygame
 from entities.entity import Entity
+from core import assets
 
 # ===============================================================
 #  BLOQUE INDESTRUCTIBLE (WALL / BLOQUE SÓLIDO)
@@ -7,26 +7,23 @@ from entities.entity import Entity
 #  - Aparece donde el mapa tiene 'S'
 # ===============================================================
 class IndestructibleBlock(Entity):
+    IMAGE_PATH = "assets/images/wall.jpg"
+
+    __slots__ = ("image",)
+
     def __init__(self, x, y, tile_size=32):
         super().__init__(x, y, tile_size)
 
-        # Cargar la imagen del bloque sólido desde assets
-        self.image = pygame.image.load("assets/images/wall.jpg").convert_alpha()
-
-        # Escalar para coincidir con el tamaño de tile
-        self.image = pygame.transform.scale(self.image, (tile_size, tile_size))
+        # Imagen del bloque sólido (compartida por todos los bloques
+        # a través de la caché, ya escalada al tamaño de tile)
+        self.image = assets.load_image(self.IMAGE_PATH, (tile_size, tile_size))
 
-    def draw(self, surface, offset_x=0, offset_y=0):
+    def sprite(self):
         """
-        Dibuja el bloque en su posición correspondiente dentro del mapa.
+        Imagen del bloque; Entity.draw la dibuja en su posición
+        correspondiente dentro del mapa.
         """
-        surface.blit(
-            self.image,
-            (
-                offset_x + self.x * self.tile_size,
-                offset_y + self.y * self.tile_size
-            )
-        )
+        return self.image
 
 
 # ===============================================================
@@ -36,25 +33,22 @@ class IndestructibleBlock(Entity):
 #  - Aparece donde el mapa tiene 'B'
 # ===============================================================
 class DestructibleBlock(Entity):
+    IMAGE_PATH = "assets/images/bridge.jpg"
+
+    __slots__ = ("item_hidden", "image")
+
     def __init__(self, x, y, item_hidden=None, tile_size=32):
         super().__init__(x, y, tile_size)
 
         # Ítem oculto dentro del bloque (o None si no tiene)
         self.item_hidden = item_hidden
 
-        # Imagen del bloque destructible
-        self.image = pygame.image.load("assets/images/bridge.jpg").convert_alpha()
-        self.image = pygame.transform.scale(self.image, (tile_size, tile_size))
+        # Imagen del bloque destructible (compartida vía caché)
+        self.image = assets.load_image(self.IMAGE_PATH, (tile_size, tile_size))
 
-    def draw(self, surface, offset_x=0, offset_y=0):
+    def sprite(self):
         """
-        Renderiza el bloque en pantalla.
+        Imagen del bloque en pantalla.
         Si una bomba lo destruye, GamePlayScreen se encarga de eliminarlo.
         """
-        surface.blit(
-            self.image,
-            (
-                offset_x + self.x * self.tile_size,
-                offset_y + self.y * self.tile_size
-            )
-        )
+        return self.image
@@ -1,12 +1,35 @@
 import pygame
 from entities.entity import Entity
-from entities.explosion import Explosion
-from entities.items import Item
+from core import assets
+from core.chain_reaction import detonate
 
 class Bomb(Entity):
+    FRAME_PATTERN = "assets/images/bomb/bomb-{}.png"
+
+    __slots__ = ("owner", "timer", "power", "exploded", "frames", "total_frames",
+                 "frame_cycle_time", "frame_time", "anim_timer", "anim_frame")
+
     def __init__(self, x, y, owner, power, timer=2000, tile_size=32):
         super().__init__(x, y, tile_size)
 
+        # Cargar y preparar animaciones de la bomba
+        self.load_sprites()
+
+        # Estado inicial (el mismo que deja reset() al reutilizarla)
+        self.reset(x, y, owner, power, timer, tile_size)
+
+    # -------------------------------------------------------------
+    # REINICIO (para reutilizar la instancia desde el pool)
+    # -------------------------------------------------------------
+    def reset(self, x, y, owner, power, timer=2000, tile_size=32):
+        self.x = x
+        self.y = y
+        self.dead = False
+
+        if tile_size != self.tile_size:
+            self.tile_size = tile_size
+            self.load_sprites()
+
         # Jugador o enemigo que la colocó
         self.owner = owner
 
@@ -19,12 +42,6 @@ class Bomb(Entity):
         # Estado de explosión
         self.exploded = False
 
-        # Si debe eliminarse del juego
-        self.dead = False
-
-        # Cargar y preparar animaciones de la bomba
-        self.load_sprites()
-
         # Total de frames de animación
         self.total_frames = len(self.frames)
 
@@ -44,19 +61,11 @@ class Bomb(Entity):
     def load_sprites(self):
         """
         Carga los frames bomb-0.png, bomb-1.png, bomb-2.png, ...
-        hasta que no existan más archivos.
+        hasta que no existan más archivos (desde la caché compartida).
         """
-        self.frames = []
-        i = 0
-        while True:
-            try:
-                img = pygame.image.load(f"assets/images/bomb/bomb-{i}.png").convert_alpha()
-                img = pygame.transform.scale(img, (self.tile_size, self.tile_size))
-                self.frames.append(img)
-                i += 1
-            except:
-                # Si falla (no existe más imagen), terminamos
-                break
+        self.frames = assets.load_sequence(
+            self.FRAME_PATTERN, (self.tile_size, self.tile_size)
+        )
 
         # Si no hay imágenes, crear un cuadrado simple de fallback
         if not self.frames:
@@ -90,96 +99,21 @@ class Bomb(Entity):
     # -------------------------------------------------------------
     def explode(self, game):
         """
-        Lógica completa al detonar:
-        - Genera explosión central
-        - Se propaga en 4 direcciones
-        - Activa otras bombas (reacción en cadena)
-        - Destruye ítems y bloques
+        Detona la bomba y, en el mismo tick, todas las que alcance
+        su explosión (reacción en cadena, ver core/chain_reaction.py):
+        - Explosión central y rayos en 4 direcciones
+        - Destruye ítems (excepto la llave) y bloques
         """
         if self.exploded:
             return  # evitar doble explosión
 
-        self.exploded = True
-        self.dead = True
-
-        # Reducir contador de bombas activas del jugador
-        self.owner.bombs_active -= 1
-
-        # Limpia la bomba del mapa (para que no sea un obstáculo)
-        game.map[self.y][self.x] = "."
-
-        # Explosión central
-        game.explosions.append(Explosion(self.x, self.y, tile_size=self.tile_size))
-
-        # Direcciones (arriba, abajo, derecha, izquierda)
-        dirs = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-
-        for dx, dy in dirs:
-            for r in range(1, self.power + 1):
-                nx = self.x + dx * r
-                ny = self.y + dy * r
-
-                cell = game.map[ny][nx]
-
-                # Si es muro sólido → para la explosión
-                if cell == "S":
-                    break
-
-                # Añadir explosión visual en este tile
-                game.explosions.append(Explosion(nx, ny, tile_size=self.tile_size))
-
-                # ---------------------------------------------------------
-                # ★ REACCIÓN EN CADENA: activar otras bombas que toque
-                # ---------------------------------------------------------
-                for other in game.bombs:
-                    if other is not self and other.x == nx and other.y == ny:
-                        if not other.exploded:
-                            other.timer = 0  # hará que explote en el próximo update
-
-                # ---------------------------------------------------------
-                # ★ Si es un ítem → la explosión lo destruye, excepto KEY
-                # ---------------------------------------------------------
-                if cell == "I":
-                    for item in game.items:
-                        if item.x == nx and item.y == ny:
-                            if item.item_type == "KEY":
-                                break  # la llave NO se destruye
-                            game.items.remove(item)
-                            break
-
-                    game.map[ny][nx] = "."
-                    break
-
-                # ---------------------------------------------------------
-                # ★ Si es un bloque destructible
-                # ---------------------------------------------------------
-                if cell == "B":
-                    for block in game.blocks:
-                        if block.x == nx and block.y == ny:
-
-                            # Si tenía ítem oculto → soltarlo
-                            if getattr(block, "item_hidden", None):
-                                game.items.append(
-                                    Item(nx, ny, block.item_hidden, tile_size=self.tile_size)
-                                )
-
-                            game.blocks.remove(block)
-                            break
-
-                    game.map[ny][nx] = "."
-                    break
+        detonate(game, self)
 
     # -------------------------------------------------------------
-    # DIBUJAR LA BOMBA EN LA PANTALLA
+    # SPRITE ACTUAL DE LA BOMBA
     # -------------------------------------------------------------
-    def draw(self, surface, offset_x=0, offset_y=0):
+    def sprite(self):
         """
-        Dibuja el frame actual de la animación de la bomba.
+        Frame actual de la animación de la bomba.
         """
-        frame = self.frames[self.anim_frame]
-
-        surface.blit(
-            frame,
-            (offset_x + self.x * self.tile_size,
-             offset_y + self.y * self.tile_size)
-        )
+        return self.frames[self.anim_frame]
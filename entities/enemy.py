@@ -1,9 +1,19 @@
 import pygame
 import random
+import config
 from entities.entity import Entity
-from collections import deque
+from core import assets
+from core.tilemap import Tile
 
 class Enemy(Entity):
+    SPRITE_PATTERN = "assets/images/enemy/{direction}-{index}.png"
+
+    __slots__ = ("name", "px", "py", "direction", "anim_frame", "anim_timer",
+                 "move_duration", "anim_speed", "moving", "move_timer",
+                 "start_px", "start_py", "target_px", "target_py",
+                 "path", "path_mask", "path_ring", "path_ring_blocks",
+                 "free_mode", "last_dir", "sprites", "ai_type", "game")
+
     def __init__(self, x, y, tile_size=32, name="Enemy"):
         super().__init__(x, y, tile_size)
 
@@ -33,8 +43,19 @@ class Enemy(Entity):
 
         # Para IA:
         self.path = []               # Ruta hacia el jugador (via BFS)
+
+        # Ruta guardada entre decisiones (ver cached_path): bits de
+        # sus tiles, de sus tiles + vecinos, y bloques que había ahí.
+        # path_mask = None → self.path no es una ruta guardada
+        self.path_mask = None
+        self.path_ring = 0
+        self.path_ring_blocks = 0
         self.free_mode = False       # Si no encuentra camino → movimiento libre
         self.last_dir = None         # Última dirección de movimiento libre
+        self.ai_type = None          # Tipo de IA según dificultad (entity_generator)
+
+        # Referencia al juego (se asigna en cada update)
+        self.game = None
 
         # Cargar sprites del enemigo
         self.load_sprites()
@@ -52,20 +73,20 @@ class Enemy(Entity):
         }
 
         directions = ["down", "up", "left", "right"]
+        size = (self.tile_size, self.tile_size)
 
         for d in directions:
             for i in range(4):
                 try:
-                    img = pygame.image.load(
-                        f"assets/images/enemy/{d}-{i}.png"
-                    ).convert_alpha()
+                    # Escalada por la caché (compartida entre enemigos)
+                    img = assets.load_image(
+                        self.SPRITE_PATTERN.format(direction=d, index=i), size
+                    )
                 except:
                     # Sprite alternativo si falta la imagen
-                    img = pygame.Surface((self.tile_size, self.tile_size))
+                    img = pygame.Surface(size)
                     img.fill((255, 80, 80))
 
-                # Escalar por si las imágenes son muy grandes
-                img = pygame.transform.scale(img, (self.tile_size, self.tile_size))
                 self.sprites[d].append(img)
 
     # ------------------------------------------------------
@@ -106,6 +127,9 @@ class Enemy(Entity):
             # Actualizar coordenadas en la grilla
             self.x = int(self.px // self.tile_size)
             self.y = int(self.py // self.tile_size)
+
+            # Posición en píxeles para las colisiones
+            game.enemy_hash.place(self, *self.hitbox())
             return
 
         # -------------------------------------------------
@@ -122,14 +146,37 @@ class Enemy(Entity):
         Si no hay ruta (bloqueado por muros), usa movimiento libre aleatorio.
         """
         player = game.player
-
-        # Buscar ruta hacia el jugador
-        self.path = self.find_path((self.x, self.y), (player.x, player.y), game)
+        goal = (player.x, player.y)
+
+        # Buscar ruta hacia el jugador: con varios enemigos, todos
+        # leen el mismo campo de distancias (un solo BFS); si no,
+        # búsqueda propia. En mapas grandes (con HPA) el BFS de todo
+        # el mapa es más caro que las rutas guardadas de cada uno,
+        # así que siempre se usa la búsqueda propia. Si el jugador
+        # está en otra región (encerrado), no se busca nada.
+        if not game.reachability.reachable((self.x, self.y), goal):
+            self.path = None
+            self.path_mask = None
+        elif (game.hpa is None
+              and len(game.enemies) >= config.DISTANCE_FIELD_MIN_ENEMIES):
+            step = game.distance_field.next_step(self.x, self.y, goal)
+            self.path = [step] if step else None
+            self.path_mask = None
+        else:
+            self.path = self.cached_path(goal, game)
 
         if self.path:
             self.free_mode = False
-            next_cx, next_cy = self.path.pop(0)
+            next_cx, next_cy = self.path[0]
             self.start_move(next_cx, next_cy, game)
+
+            if self.moving:
+                self.path.pop(0)
+                if self.path_mask is not None:
+                    self.path_mask &= ~game.bits.bit(next_cx, next_cy)
+            else:
+                # No pudo avanzar: la ruta ya no sirve
+                self.path_mask = None
         else:
             # Si no hay camino posible → movimiento aleatorio
             self.free_mode = True
@@ -199,44 +246,88 @@ class Enemy(Entity):
         self.last_dir = None
 
     # ------------------------------------------------------
-    # PATHFINDING BFS
+    # RUTA GUARDADA (se reutiliza mientras siga siendo válida)
+    # ------------------------------------------------------
+    def cached_path(self, goal, game):
+        """
+        Reutiliza la ruta anterior si sigue sirviendo y sólo la
+        recalcula si:
+          - una bomba cayó sobre ella,
+          - cambió algún bloque sobre o junto a la ruta (pudo
+            abrirse un atajo),
+          - el jugador se fue a un tile que no está en la ruta
+            ni al lado de su final.
+        Cuenta aciertos/fallos en game.path_hits/path_misses.
+        """
+        if self.path and self.path_mask is not None and self._repair_path(goal, game.bits):
+            game.path_hits += 1
+            return self.path
+
+        game.path_misses += 1
+        path = self.find_path((self.x, self.y), goal, game)
+        self._remember_path(path, game.bits)
+        return path
+
+    def _remember_path(self, path, bits):
+        if not path:
+            self.path_mask = None
+            return
+        mask = 0
+        for x, y in path:
+            mask |= bits.bit(x, y)
+        self.path_mask = mask
+        self.path_ring = mask | bits.neighbors(mask)
+        self.path_ring_blocks = bits.blocks & self.path_ring
+
+    def _repair_path(self, goal, bits):
+        """True si self.path (ajustada a `goal`) todavía es válida."""
+        path = self.path
+
+        # Debe seguir empezando junto al enemigo
+        x, y = path[0]
+        if abs(x - self.x) + abs(y - self.y) != 1:
+            return False
+
+        # Bomba sobre la ruta, o bloques cambiados alrededor
+        if bits.bombs & self.path_mask:
+            return False
+        if bits.blocks & self.path_ring != self.path_ring_blocks:
+            return False
+
+        if path[-1] == goal:
+            return True
+
+        # El jugador se acercó por la misma ruta → recortarla
+        if bits.bit(*goal) & self.path_mask:
+            del path[path.index(goal) + 1:]
+            self._remember_path(path, bits)
+            return True
+
+        # El jugador avanzó un tile más allá del final → alargarla
+        ex, ey = path[-1]
+        if (abs(goal[0] - ex) + abs(goal[1] - ey) == 1
+                and not bits.bit(*goal) & bits.blocked_for_enemies()):
+            path.append(goal)
+            self._remember_path(path, bits)
+            return True
+
+        return False
+
+    # ------------------------------------------------------
+    # PATHFINDING A* / JERÁRQUICO
     # ------------------------------------------------------
     def find_path(self, start, goal, game):
         """
-        Implementación simple de BFS para seguir al jugador.
+        A* hacia el jugador (core/astar.py), con los mismos
+        obstáculos que is_blocked() y un límite de expansiones
+        (config.PATH_NODE_BUDGET): si se agota, devuelve una ruta
+        parcial hacia el tile más cercano al jugador.
+        En mapas grandes la ruta se planea por clusters (core/hpa.py).
         Devuelve una lista de celdas para llegar al objetivo.
         """
-        queue = deque([start])
-        visited = {start: None}
-
-        while queue:
-            cx, cy = queue.popleft()
-            if (cx, cy) == goal:
-                break
-
-            for dx, dy in [(0,-1),(0,1),( -1,0),(1,0)]:
-                nx = cx + dx
-                ny = cy + dy
-
-                if (nx, ny) in visited:
-                    continue
-                if self.is_blocked(nx, ny, game):
-                    continue
-
-                visited[(nx, ny)] = (cx, cy)
-                queue.append((nx, ny))
-
-        if goal not in visited:
-            return None
-
-        # Reconstrucción del camino
-        path = []
-        node = goal
-        while node != start:
-            path.append(node)
-            node = visited[node]
-        path.reverse()
-        return path
+        if game.hpa is not None:
+            return game.hpa.find_path(start, goal, config.PATH_NODE_BUDGET)
+        return game.astar.find_path(start, goal, config.PATH_NODE_BUDGET)
 
     # ------------------------------------------------------
     # CELDA BLOQUEADA
@@ -246,30 +337,22 @@ class Enemy(Entity):
         Revisa si el tile es sólido o tiene una bomba.
         Enemigos NO pueden atravesar nada.
         """
-        if cx < 0 or cx >= len(game.map[0]) or cy < 0 or cy >= len(game.map):
-            return True
-
-        cell = game.map[cy][cx]
-        if cell in ("S", "B"):  # muro sólido o bloque destructible
+        # Fuera del mapa: el borde del TileMap es sólido
+        cell = game.map.get(cx, cy)
+        if cell == Tile.SOLID or cell == Tile.BLOCK:  # muro sólido o bloque destructible
             return True
 
         # Bombas también bloquean al enemigo
-        for b in game.bombs:
-            if b.x == cx and b.y == cy:
-                return True
-
-        return False
+        return game.occupancy.bomb_at(cx, cy) is not None
 
     # ------------------------------------------------------
-    # DIBUJO EN PANTALLA
+    # SPRITE Y POSICIÓN EN PANTALLA
     # ------------------------------------------------------
-    def draw(self, surface, offset_x=0, offset_y=0):
+    def sprite(self):
         """
-        Dibuja el sprite en base a la dirección y el frame actual.
+        Sprite en base a la dirección y el frame actual.
         """
-        img = self.sprites[self.direction][self.anim_frame]
-        surface.blit(
-            img,
-            (offset_x + int(self.px),
-             offset_y + int(self.py))
-        )
+        return self.sprites[self.direction][self.anim_frame]
+
+    def screen_pos(self, offset_x=0, offset_y=0):
+        return (offset_x + int(self.px), offset_y + int(self.py))
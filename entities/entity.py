@@ -1,6 +1,11 @@
 import pygame
+import config
 
 class Entity:
+    # Atributos fijos (sin __dict__ por instancia): cada subclase
+    # declara en su __slots__ los que agrega
+    __slots__ = ("x", "y", "tile_size", "dead", "_rect")
+
     def __init__(self, x, y, tile_size=32):
         """
         Clase base para TODO lo que existe en el mundo del juego:
@@ -15,16 +20,36 @@ class Entity:
         self.tile_size = tile_size  # tamaño del sprite/tile
         self.dead = False           # si está muerto, el juego lo eliminará
 
+        # Rect reutilizado por la propiedad `rect`
+        self._rect = pygame.Rect(0, 0, tile_size, tile_size)
+
     # ------------------------------------------------------------
     # DIBUJO BÁSICO
     # ------------------------------------------------------------
+    def sprite(self):
+        """
+        Imagen actual de la entidad (normalmente una subsurface del
+        atlas de texturas), o None si se dibuja de otra forma.
+        Las clases hijas la sobrescriben (Player, Enemy, Bomb, Item...).
+        """
+        return None
+
+    def screen_pos(self, offset_x=0, offset_y=0):
+        """Esquina superior izquierda donde se dibuja el sprite."""
+        return (
+            offset_x + self.x * self.tile_size,
+            offset_y + self.y * self.tile_size
+        )
+
     def draw(self, surface, offset_x=0, offset_y=0):
         """
-        Método vacío.
-        Las clases hijas lo *sobrescriben* para dibujarse
-        (ej: Player, Enemy, Bomb, Item...).
+        Dibuja el sprite actual en su posición.
+        GamePlayScreen agrupa estos mismos pares (sprite, posición)
+        en una sola llamada a Surface.blits().
         """
-        pass
+        img = self.sprite()
+        if img is not None:
+            surface.blit(img, self.screen_pos(offset_x, offset_y))
 
     # ------------------------------------------------------------
     # RECTÁNGULO COLLISIONABLE
@@ -35,14 +60,26 @@ class Entity:
         Devuelve un pygame.Rect que representa el área que
         ocupa la entidad en la pantalla.
 
-        Se usa para detectar colisiones o dibujar.
+        Se usa para detectar colisiones o dibujar. Es siempre el
+        mismo objeto, actualizado en el lugar: para guardarlo,
+        usar rect.copy().
         """
-        return pygame.Rect(
-            self.x * self.tile_size,
-            self.y * self.tile_size,
-            self.tile_size,
-            self.tile_size
-        )
+        r = self._rect
+        ts = self.tile_size
+        r.update(self.x * ts, self.y * ts, ts, ts)
+        return r
+
+    def hitbox(self):
+        """
+        (x, y, w, h) en píxeles del mapa para colisiones: el tile
+        que ocupa el sprite (screen_pos sin desplazamiento, así que
+        sigue la posición interpolada de quien se mueve) reducido
+        config.HITBOX_INSET por lado.
+        """
+        x, y = self.screen_pos()
+        inset = config.HITBOX_INSET
+        size = self.tile_size - 2 * inset
+        return (x + inset, y + inset, size, size)
 
     # ------------------------------------------------------------
     # ACTUALIZACIÓN DE LA ENTIDAD
@@ -2,16 +2,102 @@ import pygame
 from entities.entity import Entity
 
 class Explosion(Entity):
+    """
+    Una explosión por detonación (incluida toda su reacción en
+    cadena, ver core/chain_reaction.py), en lugar de un objeto por
+    tile alcanzado.
+
+    Cada bomba aporta un centro y cuatro brazos con su largo en
+    tiles; todos comparten el mismo temporizador. `tiles` reúne
+    todas las celdas alcanzadas (sin repetir) para las colisiones.
+
+    Los rectángulos de centros y brazos se arman una sola vez al
+    agregar cada bomba (`shape`, en píxeles del mapa) y los de
+    pantalla se guardan para el último desplazamiento usado.
+    """
+
+    __slots__ = ("duration", "max_duration", "arms", "tiles",
+                 "shape", "_screen", "_offset")
+
     def __init__(self, x, y, duration=300, tile_size=32):
-        # Llama al constructor base, guarda posición y tamaño
+        # Llama al constructor base, guarda posición (primera bomba) y tamaño
         super().__init__(x, y, tile_size)
 
+        # (x, y, ((dx, dy, largo), ...)) por cada bomba detonada
+        self.arms = []
+
+        # Celdas alcanzadas (centros + brazos)
+        self.tiles = set()
+
+        # Rectángulos en píxeles del mapa / en pantalla (ver rects())
+        self.shape = []
+        self._screen = []
+        self._offset = None
+
+        self.reset(x, y, duration, tile_size)
+
+    # ------------------------------------------------------------
+    # REINICIO (para reutilizar la instancia desde el pool)
+    # ------------------------------------------------------------
+    def reset(self, x, y, duration=300, tile_size=32):
+        self.x = x
+        self.y = y
+        self.tile_size = tile_size
+        self.dead = False
+
         # Tiempo total que dura la explosión (en milisegundos)
         self.duration = duration
 
         # Guardamos la duración original para calcular efectos visuales
         self.max_duration = duration
 
+        self.arms.clear()
+        self.tiles.clear()
+        self.shape.clear()
+        self._screen.clear()
+        self._offset = None
+
+    # ------------------------------------------------------------
+    # FORMA DE LA EXPLOSIÓN
+    # ------------------------------------------------------------
+    def add_arms(self, x, y, arms):
+        """
+        Agrega el centro (x, y) de una bomba y sus brazos:
+        arms → [(dx, dy, largo), ...] en las 4 direcciones.
+        """
+        self.arms.append((x, y, arms))
+        self.tiles.add((x, y))
+        for dx, dy, length in arms:
+            for r in range(1, length + 1):
+                self.tiles.add((x + dx * r, y + dy * r))
+
+        # Un rectángulo por centro y uno por cada brazo
+        ts = self.tile_size
+        left = x * ts
+        top = y * ts
+        self.shape.append(pygame.Rect(left, top, ts, ts))
+        for dx, dy, length in arms:
+            if length == 0:
+                continue
+            # El brazo empieza en el tile vecino al centro
+            ax = left + dx * ts if dx > 0 else left + dx * length * ts
+            ay = top + dy * ts if dy > 0 else top + dy * length * ts
+            if dx:
+                self.shape.append(pygame.Rect(ax, ay, length * ts, ts))
+            else:
+                self.shape.append(pygame.Rect(ax, ay, ts, length * ts))
+        self._offset = None
+
+    def rects(self, offset_x=0, offset_y=0):
+        """
+        Rectángulos de `shape` desplazados a pantalla. Se recalculan
+        sólo si cambió el desplazamiento o la forma.
+        """
+        if self._offset != (offset_x, offset_y):
+            self._offset = (offset_x, offset_y)
+            self._screen = [r.move(offset_x, offset_y) for r in self.shape]
+        return self._screen
+
     # ------------------------------------------------------------
     # ACTUALIZACIÓN LÓGICA DE LA EXPLOSIÓN
     # ------------------------------------------------------------
@@ -32,8 +118,9 @@ class Explosion(Entity):
     # ------------------------------------------------------------
     def draw(self, surface, offset_x=0, offset_y=0):
         """
-        Dibuja un cuadrado que cambia de intensidad (Rojo → Amarillo)
-        dependiendo del tiempo restante.
+        Dibuja centros y brazos con un color que cambia de intensidad
+        (Rojo → Amarillo) dependiendo del tiempo restante.
+        Devuelve los rectángulos dibujados.
         """
 
         # Valor entre 1.0 y 0.0 que indica cuánto le queda
@@ -45,16 +132,12 @@ class Explosion(Entity):
         B = int(20 * alpha)
         color = (R, G, B)
 
-        # Crear rectángulo en pantalla según la posición en la grilla
-        rect = pygame.Rect(
-            offset_x + self.x * self.tile_size,
-            offset_y + self.y * self.tile_size,
-            self.tile_size,
-            self.tile_size
-        )
-
-        # Dibujo del centro de la explosión
-        pygame.draw.rect(surface, color, rect)
+        rects = self.rects(offset_x, offset_y)
+        for rect in rects:
+            pygame.draw.rect(surface, color, rect)
 
         # Bordes para mayor contraste y visibilidad
-        pygame.draw.rect(surface, (255, 100, 0), rect, 2)
+        for rect in rects:
+            pygame.draw.rect(surface, (255, 100, 0), rect, 2)
+
+        return rects
@@ -1,10 +1,23 @@
-import pygame
 import os
 from entities.entity import Entity
+from core import assets
 
 class Item(Entity):
+    __slots__ = ("item_type", "base_path", "frames", "current_frame",
+                 "animation_speed", "frame_counter")
+
     def __init__(self, x, y, item_type, tile_size=32, base_path="assets/images/items"):
         super().__init__(x, y, tile_size)
+        self.reset(x, y, item_type, tile_size, base_path)
+
+    # ------------------------------------------------------------
+    # REINICIO (para reutilizar la instancia desde el pool)
+    # ------------------------------------------------------------
+    def reset(self, x, y, item_type, tile_size=32, base_path="assets/images/items"):
+        self.x = x
+        self.y = y
+        self.tile_size = tile_size
+        self.dead = False
 
         # Tipo de item: FIRE, BOMB, SPEED, KEY, etc.
         self.item_type = item_type
@@ -30,28 +43,17 @@ class Item(Entity):
         assets/images/items/<ITEM_TYPE>/image-2.jpg
         etc.
         Hasta que deje de existir un archivo.
+        Los frames se comparten entre todos los ítems del mismo tipo.
         """
 
         folder_path = os.path.join(self.base_path, item_type)
-        frames = []
-        index = 1
 
         # Intentar cargar image-1.jpg, image-2.jpg, image-3.jpg, ...
-        while True:
-            img_path = os.path.join(folder_path, f"image-{index}.jpg")
-
-            # Si no existe, se detiene la carga
-            if not os.path.exists(img_path):
-                break
-
-            # Cargar imagen
-            image = pygame.image.load(img_path).convert_alpha()
-
-            # Redimensionar a tamaño del tile
-            image = pygame.transform.scale(image, (self.tile_size, self.tile_size))
-
-            frames.append(image)
-            index += 1
+        frames = assets.load_sequence(
+            self.frame_pattern(item_type, self.base_path),
+            (self.tile_size, self.tile_size),
+            start=1
+        )
 
         # Si no hay imágenes → error de configuración
         if not frames:
@@ -59,6 +61,11 @@ class Item(Entity):
 
         return frames
 
+    @staticmethod
+    def frame_pattern(item_type, base_path="assets/images/items"):
+        """Patrón de archivos de la animación de un tipo de ítem."""
+        return os.path.join(base_path, item_type, "image-{}.jpg")
+
     # ------------------------------------------------------------
     # EFECTOS AL RECOGER EL ÍTEM
     # ------------------------------------------------------------
@@ -118,18 +125,11 @@ class Item(Entity):
     # ------------------------------------------------------------
     # DIBUJAR ÍTEM EN PANTALLA
     # ------------------------------------------------------------
+    def sprite(self):
+        # Frame actual
+        return self.frames[self.current_frame]
+
     def draw(self, surface, offset_x=0, offset_y=0):
-        # Avanzar animación
+        # Avanzar animación y dibujar el frame actual
         self.update_animation()
-
-        # Frame actual
-        img = self.frames[self.current_frame]
-
-        # Dibujarlo basado en su posición dentro del mapa
-        surface.blit(
-            img,
-            (
-                offset_x + self.x * self.tile_size,
-                offset_y + self.y * self.tile_size
-            )
-        )
+        super().draw(surface, offset_x, offset_y)
@@ -1,7 +1,20 @@
 import pygame
 from entities.entity import Entity
+from core import assets
+from core.tilemap import Tile
 
 class Player(Entity):
+    SPRITE_PATTERN = "assets/images/bombman/{direction}-{index}.png"
+
+    __slots__ = ("px", "py", "direction", "anim_frame", "anim_timer", "anim_speed",
+                 "moving", "sprites", "move_duration", "move_timer",
+                 "start_px", "start_py", "target_px", "target_py",
+                 "has_key", "speed", "bomb_range", "bomb_capacity", "bombs_active",
+                 "lives", "invincible", "invincible_timer", "shield",
+                 "can_walk_through_blocks", "can_walk_through_bombs",
+                 "walk_blocks_timer", "walk_bombs_timer", "bombs_currently_passable",
+                 "move_up", "move_down", "move_left", "move_right", "game")
+
     def __init__(self, x, y, tile_size=32):
         super().__init__(x, y, tile_size)
 
@@ -24,6 +37,8 @@ class Player(Entity):
         # Movimiento interpolado (suave)
         self.move_duration = 200  # ms que tarda en moverse un tile
         self.move_timer = 0
+        self.start_px = self.px
+        self.start_py = self.py
         self.target_px = self.px
         self.target_py = self.py
 
@@ -40,6 +55,7 @@ class Player(Entity):
         self.lives = 3
         self.invincible = False
         self.invincible_timer = 0  # cuánto tiempo queda invencible
+        self.shield = False        # escudo (ítem SHIELD): absorbe un golpe
 
         # Power-ups temporales
         self.can_walk_through_blocks = False
@@ -54,6 +70,9 @@ class Player(Entity):
         self.move_up = self.move_down = False
         self.move_left = self.move_right = False
 
+        # Referencia al juego (se asigna en cada update)
+        self.game = None
+
     # ------------------------------------------------------------
     # CARGA DE SPRITES
     # ------------------------------------------------------------
@@ -66,14 +85,13 @@ class Player(Entity):
             "right": []
         }
 
-        # Carga imágenes del disco
+        # Imágenes desde la caché compartida (se decodifican una sola vez)
+        size = (self.tile_size, self.tile_size)
         for direction in self.sprites.keys():
             for i in range(4):
-                img = pygame.image.load(
-                    f"assets/images/bombman/{direction}-{i}.png"
-                ).convert_alpha()
-
-                img = pygame.transform.scale(img, (self.tile_size, self.tile_size))
+                img = assets.load_image(
+                    self.SPRITE_PATTERN.format(direction=direction, index=i), size
+                )
                 self.sprites[direction].append(img)
 
     # ------------------------------------------------------------
@@ -85,7 +103,7 @@ class Player(Entity):
             return
 
         # Si tiene escudo, se consume y da invencibilidad larga
-        if getattr(self, "shield", False):
+        if self.shield:
             self.shield = False
             self.invincible = True
             self.invincible_timer = 5000
@@ -126,6 +144,10 @@ class Player(Entity):
     # COLOCAR BOMBA
     # ------------------------------------------------------------
     def try_place_bomb(self):
+        # Todavía sin juego asignado (antes del primer update)
+        if self.game is None:
+            return False
+
         # No puede colocar más bombas de las permitidas
         if self.bombs_active >= self.bomb_capacity:
             return False
@@ -136,20 +158,20 @@ class Player(Entity):
 
         # No se pueden poner bombas sobre:
         # O = portal, B = bloque, E = enemigo
-        cell = self.game.map[tile_y][tile_x]
-        if cell in ("O", "B", "E"):
+        cell = self.game.map.get(tile_x, tile_y)
+        if cell in (Tile.PORTAL, Tile.BLOCK, Tile.ENEMY):
             return False
 
         # No puedes poner 2 bombas en el mismo tile
-        for b in self.game.bombs:
-            if b.x == tile_x and b.y == tile_y:
-                return False
+        if self.game.occupancy.bomb_at(tile_x, tile_y) is not None:
+            return False
 
-        # Crear y registrar la bomba
-        from entities.bomb import Bomb
-        bomb = Bomb(tile_x, tile_y, self, self.bomb_range, tile_size=self.tile_size)
+        # Crear (o reutilizar del pool) y registrar la bomba
+        bomb = self.game.bomb_pool.acquire(
+            tile_x, tile_y, self, self.bomb_range, tile_size=self.tile_size
+        )
 
-        self.game.bombs.append(bomb)
+        self.game.add_bomb(bomb)
         self.bombs_active += 1
 
         # Mientras el jugador esté sobre su propia bomba, la puede atravesar
@@ -271,30 +293,26 @@ class Player(Entity):
     # COLISIONES CON MUROS Y BOMBAS
     # ------------------------------------------------------------
     def is_blocked(self, cx, cy, game):
-        # Fuera del mapa
-        if cx < 0 or cx >= len(game.map[0]) or cy < 0 or cy >= len(game.map):
-            return True
-
-        cell = game.map[cy][cx]
+        # Fuera del mapa: el borde del TileMap es sólido
+        cell = game.map.get(cx, cy)
 
         # Muro sólido
-        if cell == "S":
+        if cell == Tile.SOLID:
             return True
 
         # Bloque destructible (solo si no tiene WallPass)
-        if cell == "B" and not self.can_walk_through_blocks:
+        if cell == Tile.BLOCK and not self.can_walk_through_blocks:
             return True
 
         # Bombas
-        for b in game.bombs:
-            if b.x == cx and b.y == cy:
-                # BombPass permite pasar
-                if self.can_walk_through_bombs:
-                    return False
-                # Bomba actual recién puesta → permitir pasar
-                if (cx, cy) in self.bombs_currently_passable:
-                    return False
-                return True
+        if game.occupancy.bomb_at(cx, cy) is not None:
+            # BombPass permite pasar
+            if self.can_walk_through_bombs:
+                return False
+            # Bomba actual recién puesta → permitir pasar
+            if (cx, cy) in self.bombs_currently_passable:
+                return False
+            return True
 
         return False
 
@@ -302,14 +320,10 @@ class Player(Entity):
     def is_inside_block_or_bomb(self, game):
         cx, cy = self.x, self.y
 
-        if game.map[cy][cx] == "B":
+        if game.map.get(cx, cy) == Tile.BLOCK:
             return True
 
-        for b in game.bombs:
-            if b.x == cx and b.y == cy:
-                return True
-
-        return False
+        return game.occupancy.bomb_at(cx, cy) is not None
 
     # Empuja al jugador fuera del bloque o bomba cuando termina un power-up
     def force_eject_from_block(self, game):
@@ -319,7 +333,7 @@ class Player(Entity):
         for dx, dy in dirs:
             nx, ny = cx + dx, cy + dy
 
-            if 0 <= nx < len(game.map[0]) and 0 <= ny < len(game.map):
+            if game.map.in_bounds(nx, ny):
                 if not self.is_blocked(nx, ny, game):
                     # Mover directamente al sector libre
                     self.px = nx * self.tile_size
@@ -342,28 +356,21 @@ class Player(Entity):
     # RECOLECCIÓN DE ITEMS
     # ------------------------------------------------------------
     def pick_up_items(self, game):
-        items_to_remove = []
-
         # Si el jugador está encima del item → aplicarlo
-        for item in game.items:
-            if self.x == item.x and self.y == item.y:
-                item.apply(self)
-                items_to_remove.append(item)
+        item = game.items.get(self.x, self.y)
+        if item is not None:
+            item.apply(self)
 
-        # Removerlos del mundo
-        for item in items_to_remove:
-            game.items.remove(item)
+            # Removerlo del mundo
+            game.remove_item(item)
 
     # ------------------------------------------------------------
-    # DIBUJAR SPRITE
+    # SPRITE Y POSICIÓN
     # ------------------------------------------------------------
-    def draw(self, surface, offset_x=0, offset_y=0):
+    def sprite(self):
         # Escoge el frame correcto según la dirección y animación
-        img = self.sprites[self.direction][self.anim_frame]
+        return self.sprites[self.direction][self.anim_frame]
 
-        # Dibujar personaje en pantalla
-        surface.blit(
-            img,
-            (offset_x + int(self.px),
-             offset_y + int(self.py))
-        )
+    def screen_pos(self, offset_x=0, offset_y=0):
+        # Posición interpolada en píxeles (movimiento suave)
+        return (offset_x + int(self.px), offset_y + int(self.py))
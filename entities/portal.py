@@ -1,7 +1,12 @@
-import pygame
 from entities.entity import Entity
+from core import assets
 
 class Portal(Entity):
+    OPEN_PATH = "assets/images/open_door.jpg"
+    CLOSED_PATH = "assets/images/closed_door.jpg"
+
+    __slots__ = ("open", "img_open", "img_closed")
+
     def __init__(self, x, y, tile_size=32):
         # Llama al constructor base (Entity ya maneja posición x,y y tamaño)
         super().__init__(x, y, tile_size)
@@ -11,29 +16,15 @@ class Portal(Entity):
         #   True  → abierta (si tienes llave puedes ganar)
         self.open = False
 
-        # Cargar imágenes desde disco SOLO UNA VEZ
-        # (evita recargar en cada frame y mejora rendimiento)
-        self.img_open = pygame.image.load("assets/images/open_door.jpg").convert_alpha()
-        self.img_closed = pygame.image.load("assets/images/closed_door.jpg").convert_alpha()
-
-        # Ajustar todas las imágenes al tamaño de celda del mapa
-        self.img_open = pygame.transform.scale(self.img_open, (self.tile_size, self.tile_size))
-        self.img_closed = pygame.transform.scale(self.img_closed, (self.tile_size, self.tile_size))
+        # Imágenes desde la caché de sprites, ya ajustadas al tamaño
+        # de celda (se cargan de disco una sola vez por proceso)
+        size = (self.tile_size, self.tile_size)
+        self.img_open = assets.load_image(self.OPEN_PATH, size)
+        self.img_closed = assets.load_image(self.CLOSED_PATH, size)
 
     # --------------------------------------------------------
-    #   DIBUJAR PORTAL (depende de si está abierto o cerrado)
+    #   SPRITE DEL PORTAL (depende de si está abierto o cerrado)
     # --------------------------------------------------------
-    def draw(self, surface, offset_x=0, offset_y=0):
-        # Posición física del tile en la pantalla
-        rect = (
-            offset_x + self.x * self.tile_size,
-            offset_y + self.y * self.tile_size,
-            self.tile_size,
-            self.tile_size
-        )
-
+    def sprite(self):
         # Elegir la imagen que corresponde al estado
-        img = self.img_open if self.open else self.img_closed
-
-        # Dibujar el portal
-        surface.blit(img, rect)
+        return self.img_open if self.open else self.img_closed
@@ -7,6 +7,10 @@ class BaseScreen:
     métodos de entrada, manejo de eventos, actualización y dibujo.
     """
 
+    # ¿Necesita dibujarse cada frame? Los menús ponen False: con
+    # config.RENDER_ON_DEMAND sólo se redibujan cuando algo cambia
+    continuous = True
+
     def __init__(self, app):
         """
         Guarda una referencia al controlador principal (app),
@@ -19,6 +23,15 @@ class BaseScreen:
         """
         self.app = app
 
+        # Botones de la pantalla (las subclases llenan la lista)
+        self.buttons = []
+
+        # El primer frame (y tras invalidate) se muestra completo
+        self._full_redraw = True
+
+        # Hay cambios aún no dibujados (render a demanda)
+        self._stale = True
+
     def on_enter(self):
         """
         Llamado automáticamente cuando la pantalla se activa.
@@ -29,6 +42,14 @@ class BaseScreen:
         """
         pass
 
+    def on_exit(self):
+        """
+        Llamado automáticamente cuando la pantalla deja de estar activa
+        (justo antes de activar la siguiente).
+        Ideal para liberar recursos o desactivar estados globales.
+        """
+        pass
+
     def handle_event(self, event):
         """
         Manejo de eventos individuales de pygame.
@@ -61,3 +82,34 @@ class BaseScreen:
         - HUD
         """
         pass
+
+    def invalidate(self):
+        """Fuerza que el próximo frame se dibuje y se muestre completo."""
+        self._full_redraw = True
+        self._stale = True
+
+    def needs_redraw(self):
+        """
+        Render a demanda: ¿hay algo nuevo que dibujar?
+        Sí tras invalidate() o si el mouse entró/salió de un botón.
+        """
+        return self._stale or any(b.hover_changed() for b in self.buttons)
+
+    def mark_drawn(self):
+        """App avisa que el estado actual ya está en pantalla."""
+        self._stale = False
+
+    def get_dirty_rects(self):
+        """
+        Zonas de la ventana que cambiaron en el último draw(), para el
+        modo dirty-rect (config.DIRTY_RECTS):
+        - None → actualizar la pantalla completa
+        - lista de pygame.Rect (puede ser vacía) → sólo esas zonas
+
+        Por defecto: completa tras invalidate(); si no, sólo los
+        botones cuyo estado hover cambió.
+        """
+        if self._full_redraw:
+            self._full_redraw = False
+            return None
+        return [b.rect for b in self.buttons if b.consume_dirty()]
@@ -1,10 +1,13 @@
 import config
 from screens.base_screen import BaseScreen
 from core.button import Button
-from core.utils import play_music
+from core.utils import play_music, render_text
 
 
 class DefeatScreen(BaseScreen):
+    # Menú estático: sólo se redibuja ante input o cambios de hover
+    continuous = False
+
     def __init__(self, app, difficulty, level_index):
         super().__init__(app)
 
@@ -73,7 +76,7 @@ class DefeatScreen(BaseScreen):
         w, h = config.WIDTH, config.HEIGHT
 
         # Título grande: "Derrota"
-        t = self.app.font_large.render("Derrota", True, config.COLOR_TEXT)
+        t = render_text(self.app.font_large, "Derrota", True, config.COLOR_TEXT)
         s.blit(t, t.get_rect(center=(w // 2, h * 0.2)))
 
         # Mensajes informativos (dificultad, nivel, motivación)
@@ -85,7 +88,7 @@ class DefeatScreen(BaseScreen):
 
         y = h * 0.35
         for line in info:
-            txt = self.app.font_medium.render(line, True, config.COLOR_TEXT)
+            txt = render_text(self.app.font_medium, line, True, config.COLOR_TEXT)
             s.blit(txt, txt.get_rect(center=(w // 2, y)))
             y += 45
 
@@ -105,6 +108,9 @@ class DefeatScreen(BaseScreen):
     # ---------------------------------------------------------
     def go_gameplay(self):
         from screens.gameplay import GamePlayScreen
+
+        # Terminar la precarga (instantáneo si ya acabó en segundo plano)
+        self.app.preloader.finish()
         self.app.change_screen(
             GamePlayScreen(self.app, self.diff, self.index)
         )
@@ -2,9 +2,12 @@ import pygame
 import config
 from screens.base_screen import BaseScreen
 from core.button import Button
-from core.utils import play_music
+from core.utils import play_music, render_text
 
 class DifficultyScreen(BaseScreen):
+    # Menú estático: sólo se redibuja ante input o cambios de hover
+    continuous = False
+
     def __init__(self, app):
         super().__init__(app)
 
@@ -99,7 +102,8 @@ class DifficultyScreen(BaseScreen):
         w, h = config.WIDTH, config.HEIGHT
 
         # Título principal
-        title = self.app.font_large.render(
+        title = render_text(
+            self.app.font_large,
             "Elige la dificultad",
             True,
             config.COLOR_TEXT
@@ -107,7 +111,8 @@ class DifficultyScreen(BaseScreen):
         s.blit(title, title.get_rect(center=(w//2, h*0.15)))
 
         # Subtítulo informativo
-        subtitle = self.app.font_small.render(
+        subtitle = render_text(
+            self.app.font_small,
             "Desbloquea todas las fases de una dificultad para acceder a la siguiente.",
             True,
             config.COLOR_TEXT
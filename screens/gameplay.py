@@ -1,11 +1,29 @@
 import pygame
 import config
 from screens.base_screen import BaseScreen
-from core.utils import play_music
+from core.utils import play_music, render_text
+from core import assets
 from core.maps import LEVEL_MAPS
 from core.entity_generator import generate_entities
+from core.preload import build_manifest, warm
+from core.occupancy import OccupancyGrid
+from core.spatial import SpatialHash
+from core.registry import TileRegistry
+from core.tilemap import TileMap
+from core.bitboard import LevelBits
+from core.blast import BlastTable
+from core.distance_field import DistanceField
+from core.components import Reachability
+from core.astar import AStar
+from core.hpa import HierarchicalPathfinder
+from core.pool import Pool, compact
+from entities.bomb import Bomb
+from entities.explosion import Explosion
+from entities.items import Item
 
 class GamePlayScreen(BaseScreen):
+    BG_COLOR = (180, 180, 180)
+
     def __init__(self, app, difficulty, level_index):
         super().__init__(app)
 
@@ -29,36 +47,106 @@ class GamePlayScreen(BaseScreen):
         # -------------------------------
         # ENTIDADES Y ESTRUCTURAS DEL JUEGO
         # -------------------------------
-        self.blocks = []
+        self.blocks = TileRegistry()    # (x, y) → bloque, orden estable
         self.enemies = []
-        self.items = []
+        self.items = TileRegistry()     # (x, y) → ítem
         self.bombs = []
         self.explosions = []
         self.player = None
         self.portal = None
 
+        # Instancias reutilizables de las entidades de vida corta
+        self.bomb_pool = Pool(Bomb)
+        self.explosion_pool = Pool(Explosion)
+        self.item_pool = Pool(Item)
+
+        # Índice tile → bomba/explosiones (consultas O(1))
+        self.occupancy = OccupancyGrid()
+
         # Tamaño de tiles (cuadrícula)
         self.tile = 32
 
-        # Copia la matriz del mapa como lista de listas editable
-        self.map = [list(row) for row in LEVEL_MAPS[level_index]]
+        # Enemigos por posición en píxeles (colisiones a mitad de movimiento)
+        self.enemy_hash = SpatialHash(self.tile)
+        self._hits = []   # resultado reutilizado de enemy_hash.query()
+
+        # Mapa compacto (un byte por tile, borde sólido) editable
+        self.map = TileMap.from_rows(LEVEL_MAPS[level_index])
+
+        # Precargar TODO lo que el nivel puede necesitar (sprites,
+        # bombas, ítems...) para no tocar el disco durante la partida
+        warm(build_manifest(LEVEL_MAPS[level_index], self.tile, config.FLOOR_IMAGE_PATH))
+
+        # Empaquetar lo precargado en un atlas de texturas: las
+        # entidades creadas a continuación dibujan desde él
+        assets.pack_atlas()
 
         # Genera entidades según la matriz del nivel
         generate_entities(self, self.map)
 
+        # Bitboards de muros/bloques/bombas/explosiones (consultas
+        # sobre el mapa entero con operaciones de bits)
+        self.bits = LevelBits(self.map)
+
+        # Regiones conectadas: descarta búsquedas de camino imposibles
+        self.reachability = Reachability(self.bits)
+
+        # Búsqueda A* (arreglos reutilizados entre llamadas)
+        self.astar = AStar(self.bits)
+
+        # En mapas grandes, las búsquedas largas se planean por clusters
+        self.hpa = None
+        if self.map.width * self.map.height >= config.HPA_MIN_TILES:
+            self.hpa = HierarchicalPathfinder(
+                self.map, self.bits, self.astar, config.HPA_CLUSTER_SIZE
+            )
+
+        # Rutas de enemigos reutilizadas / recalculadas (depuración)
+        self.path_hits = 0
+        self.path_misses = 0
+
+        # Distancias al jugador compartidas por todos los enemigos
+        self.distance_field = DistanceField(self.bits)
+
+        # Alcance de las explosiones hasta el muro sólido más cercano
+        # (los muros no cambian: se calcula una sola vez)
+        self.blast = BlastTable(self.map)
+
         # Aplica configuración inicial al jugador
         if self.player:
             self.player.lives = self.initial_player_lives
             self.player.bomb_range += self.extra_fire
 
         # Cargar imagen del piso (pasto verde)
-        self.grass_img = pygame.image.load("assets/images/grass.jpg").convert_alpha()
-        self.grass_img = pygame.transform.scale(self.grass_img, (self.tile, self.tile))
+        self.grass_img = assets.load_image(config.FLOOR_IMAGE_PATH, (self.tile, self.tile))
+
+        # Capa estática pre-renderizada: piso + bloques. Sólo cambia
+        # cuando una explosión destruye un bloque (invalidate_tile)
+        self.background = self._build_background()
+
+        # Zonas de pantalla dibujadas en el último frame y tiles del
+        # fondo que cambiaron (para el modo dirty-rect, ver draw())
+        self._drawn = []
+        self._invalid = []
+        self._dirty = None
 
     def on_enter(self):
         """Acciones al entrar en la pantalla: reproducir música del nivel."""
         self.app.current_music = play_music(config.MUSIC_GAME, self.app.current_music)
 
+        # Desde aquí cualquier lectura de imágenes cuenta como tardía
+        assets.begin_gameplay()
+
+    def on_exit(self):
+        """
+        Al salir de la partida se permite volver a leer de disco y
+        se libera la caché de imágenes (y sus atlas); la precarga
+        vuelve a empezar mientras se muestran los menús.
+        """
+        assets.end_gameplay()
+        assets.clear()
+        self.app.start_preload()
+
     def handle_event(self, event):
         """Procesa entradas del usuario: movimiento, bombas, escape, etc."""
         if self.player:
@@ -82,14 +170,20 @@ class GamePlayScreen(BaseScreen):
         # -----------------------
         for b in self.bombs:
             b.update(dt, self)
-        self.bombs = [b for b in self.bombs if not b.dead]
+        compact(self.bombs, self.bomb_pool)
 
         # -----------------------
         # Actualizar explosiones
         # -----------------------
         for e in self.explosions:
             e.update(dt, self)
-        self.explosions = [e for e in self.explosions if not e.dead]
+        for e in self.explosions:
+            if e.dead:
+                for x, y in e.tiles:
+                    self.occupancy.remove_explosion(x, y)
+                    if not self.occupancy.has_explosion(x, y):
+                        self.bits.clear_explosion(x, y)
+        compact(self.explosions, self.explosion_pool)
 
         # -----------------------
         # Actualizar enemigos
@@ -101,31 +195,31 @@ class GamePlayScreen(BaseScreen):
         # Daño al jugador por explosiones
         # -----------------------
         if self.player and not self.player.dead:
-            for e in self.explosions:
-                if int(self.player.x) == e.x and int(self.player.y) == e.y:
-                    self.player.take_damage(self)
-                    break
+            if self.bits.in_explosion(int(self.player.x), int(self.player.y)):
+                self.player.take_damage(self)
 
         # -----------------------
         # Eliminación de enemigos golpeados por explosión
         # -----------------------
-        enemies_to_remove = []
-        for en in self.enemies:
-            for e in self.explosions:
-                if en.x == e.x and en.y == e.y:
-                    enemies_to_remove.append(en)
-                    break
-        for en in enemies_to_remove:
-            self.enemies.remove(en)
+        # Cada brazo de explosión es un rectángulo (armado al crearla):
+        # sólo se revisan los enemigos de las celdas que cubre
+        killed = False
+        hits = self._hits
+        for ex in self.explosions:
+            for rect in ex.shape:
+                for en in self.enemy_hash.query(rect, hits):
+                    en.dead = True
+                    self.enemy_hash.remove(en)
+                    killed = True
+        if killed:
+            compact(self.enemies)
 
         # -----------------------
         # Daño al jugador por contacto con enemigos
         # -----------------------
         if self.player and not self.player.dead:
-            for en in self.enemies:
-                if int(self.player.x) == en.x and int(self.player.y) == en.y:
-                    self.player.take_damage(self)
-                    break
+            if self.enemy_hash.query(self.player.hitbox(), self._hits):
+                self.player.take_damage(self)
 
         # -----------------------
         # Función del portal (puerta de salida)
@@ -147,6 +241,42 @@ class GamePlayScreen(BaseScreen):
             if self.time_limit <= 0:
                 self.go_defeat()
 
+    # -----------------------------------
+    # ALTAS Y BAJAS (listas + índice de ocupación + bitboards)
+    # (bloques e ítems ya están indexados por tile: TileRegistry)
+    # -----------------------------------
+
+    def add_bomb(self, bomb):
+        self.bombs.append(bomb)
+        self.occupancy.add_bomb(bomb)
+        self.bits.set_bomb(bomb.x, bomb.y)
+        self.reachability.invalidate()
+
+    def remove_bomb(self, bomb):
+        # La bomba sigue en self.bombs hasta el filtrado de update()
+        self.occupancy.remove_bomb(bomb)
+        self.bits.clear_bomb(bomb.x, bomb.y)
+        self.reachability.invalidate()
+
+    def remove_block(self, x, y):
+        block = self.blocks.pop(x, y)
+        self.bits.clear_block(x, y)
+        self.reachability.open_tile(x, y)
+        if self.hpa is not None:
+            self.hpa.open_tile(x, y)
+        return block
+
+    def remove_item(self, item):
+        self.items.remove(item)
+        self.item_pool.release(item)
+
+    def add_explosion(self, explosion):
+        # Una explosión cubre varios tiles (centros + brazos)
+        self.explosions.append(explosion)
+        for x, y in explosion.tiles:
+            self.occupancy.add_explosion(x, y)
+            self.bits.set_explosion(x, y)
+
     def draw_hud(self, s):
         """Dibuja HUD estilo Bomberman NES."""
         font = self.app.font_small
@@ -160,15 +290,15 @@ class GamePlayScreen(BaseScreen):
         # Vidas
         lives = self.player.lives if self.player else 0
 
-        # HUD tipo clásico NES
-        text_left = font.render(f"TIEMPO {time_left}", True, (255, 255, 255))
-        text_mid = font.render(f"{score}", True, (255, 255, 255))
-        text_right = font.render(f"TI {lives}", True, (255, 255, 255))
+        # HUD tipo clásico NES: contadores armados desde el atlas de
+        # glifos (cambian casi cada frame, no se rasterizan de nuevo)
+        glyphs = self.app.glyphs_small
+        text_mid = f"{score}"
 
         # Posición de cada elemento en pantalla
-        s.blit(text_left, (30, 10))
-        s.blit(text_mid, (config.WIDTH // 2 - text_mid.get_width() // 2, 10))
-        s.blit(text_right, (config.WIDTH - 120, 10))
+        self._drawn.append(glyphs.draw(s, f"TIEMPO {time_left}", (30, 10)))
+        self._drawn.append(glyphs.draw(s, text_mid, (config.WIDTH // 2 - glyphs.size(text_mid)[0] // 2, 10)))
+        self._drawn.append(glyphs.draw(s, f"TI {lives}", (config.WIDTH - 120, 10)))
 
         # -----------------------
         # HUD técnico (información extra)
@@ -187,14 +317,69 @@ class GamePlayScreen(BaseScreen):
 
         y = config.HEIGHT - 160
         for line in tech_lines:
-            t = font.render(line, True, (255, 255, 255))
-            s.blit(t, (30, y))
+            t = render_text(font, line, True, (255, 255, 255))
+            self._drawn.append(s.blit(t, (30, y)))
             y += t.get_height()
 
+        # -----------------------
+        # Datos de depuración (columna aparte, arriba a la derecha)
+        # -----------------------
+        if config.DEBUG:
+            debug_lines = [
+                f"Disco en juego: {assets.late_loads}",
+                f"Rutas: {self.path_hits} aciertos / {self.path_misses} fallos",
+                f"A* cortadas por el límite: {self.astar.truncated}",
+                f"Campo de distancias: {self.distance_field.rebuilds} BFS",
+                f"Componentes: {self.reachability.rebuilds} recálculos",
+            ]
+            if self.hpa is not None:
+                debug_lines.append(
+                    f"HPA: {self.hpa.abstract_searches} por grafo / {self.hpa.fallbacks} A* completo"
+                )
+            y = 40
+            for line in debug_lines:
+                t = render_text(font, line, True, (255, 255, 255))
+                self._drawn.append(s.blit(t, (config.WIDTH - 20 - t.get_width(), y)))
+                y += t.get_height()
+
+    # -----------------------------------
+    # CAPA ESTÁTICA (PISO + BLOQUES)
+    # -----------------------------------
+
+    def _build_background(self):
+        """Dibuja una vez el piso y todos los bloques en una Surface aparte."""
+        grid_w = self.map.width * self.tile
+        grid_h = self.map.height * self.tile
+        bg = pygame.Surface((grid_w, grid_h)).convert()
+
+        bg.blits(
+            [(self.grass_img, (x * self.tile, y * self.tile))
+             for y in range(self.map.height) for x in range(self.map.width)],
+            False
+        )
+        bg.blits([(b.sprite(), b.screen_pos()) for b in self.blocks], False)
+        return bg
+
+    def invalidate_tile(self, x, y):
+        """
+        Vuelve a dibujar un único tile de la capa estática
+        (por ejemplo, cuando un bloque es destruido).
+        """
+        pos = (x * self.tile, y * self.tile)
+        self.background.blit(self.grass_img, pos)
+        block = self.blocks.get(x, y)
+        if block is not None:
+            self.background.blit(block.sprite(), pos)
+
+        # En modo dirty-rect, la zona de pantalla también debe actualizarse
+        offset_x, offset_y = self.get_map_offset()
+        self._invalid.append(pygame.Rect(offset_x + pos[0], offset_y + pos[1],
+                                         self.tile, self.tile))
+
     def get_map_offset(self):
         """Centra dinámicamente el mapa dentro de la pantalla."""
-        grid_w = len(self.map[0]) * self.tile
-        grid_h = len(self.map) * self.tile
+        grid_w = self.map.width * self.tile
+        grid_h = self.map.height * self.tile
 
         offset_x = (config.WIDTH - grid_w) // 2
         offset_y = (config.HEIGHT - grid_h) // 2
@@ -203,33 +388,66 @@ class GamePlayScreen(BaseScreen):
     def draw(self):
         """Dibuja todo: fondo, tiles, entidades, explosiones, HUD."""
         s = self.app.screen
-        s.fill((180, 180, 180))  # fondo gris estilo NES
-
         offset_x, offset_y = self.get_map_offset()
 
-        # Dibujar piso del mapa
-        for y, row in enumerate(self.map):
-            for x, tile in enumerate(row):
-                s.blit(self.grass_img, (offset_x + x * self.tile,
-                                        offset_y + y * self.tile))
-
-        # Dibujar bloques, ítems, bombas, explosiones, enemigos y jugador
-        for b in self.blocks:     b.draw(s, offset_x, offset_y)
-        for it in self.items:     it.draw(s, offset_x, offset_y)
-        for bomb in self.bombs:   bomb.draw(s, offset_x, offset_y)
-        for ex in self.explosions:ex.draw(s, offset_x, offset_y)
-        if self.portal:           self.portal.draw(s, offset_x, offset_y)
-        for en in self.enemies:   en.draw(s, offset_x, offset_y)
-        if self.player:           self.player.draw(s, offset_x, offset_y)
+        # Zonas dibujadas el frame anterior (se borran en modo dirty-rect)
+        previous = self._drawn + self._invalid
+        self._drawn = []
+        self._invalid = []
+
+        if self._full_redraw or not config.DIRTY_RECTS:
+            s.fill(self.BG_COLOR)  # fondo gris estilo NES
+
+            # Piso y bloques: una sola copia de la capa estática
+            s.blit(self.background, (offset_x, offset_y))
+        else:
+            # Sólo se restaura el fondo bajo lo que se dibujó antes
+            for r in previous:
+                self._restore(s, r, offset_x, offset_y)
+
+        # Dibujar ítems, bombas, explosiones, enemigos y jugador.
+        # Los sprites salen del atlas y se envían en lotes con blits()
+        for it in self.items:     it.update_animation()
+        self._blit_batch(s, self.items, offset_x, offset_y)
+        self._blit_batch(s, self.bombs, offset_x, offset_y)
+        for ex in self.explosions:
+            self._drawn += ex.draw(s, offset_x, offset_y)
+        if self.portal:           self._blit_batch(s, (self.portal,), offset_x, offset_y)
+        self._blit_batch(s, self.enemies, offset_x, offset_y)
+        if self.player:           self._blit_batch(s, (self.player,), offset_x, offset_y)
 
         # Nivel actual en la esquina inferior izquierda
         bottom_font = self.app.font_small
-        lvl_text = bottom_font.render(f"NIVEL: {self.level_index + 1} - {self.diff}", True, (255, 255, 255))
-        s.blit(lvl_text, (20, config.HEIGHT - 40))
+        lvl_text = render_text(bottom_font, f"NIVEL: {self.level_index + 1} - {self.diff}", True, (255, 255, 255))
+        self._drawn.append(s.blit(lvl_text, (20, config.HEIGHT - 40)))
 
         # Dibujar HUD principal
         self.draw_hud(s)
 
+        # Para App: pantalla completa o sólo lo que cambió
+        self._dirty = previous + self._drawn
+
+    def _blit_batch(self, s, entities, offset_x, offset_y):
+        """
+        Dibuja un grupo de entidades con una única llamada a blits()
+        y anota las zonas tocadas (para el modo dirty-rect).
+        """
+        self._drawn += s.blits(
+            (e.sprite(), e.screen_pos(offset_x, offset_y)) for e in entities
+        )
+
+    def _restore(self, s, rect, offset_x, offset_y):
+        """Repinta una zona de la pantalla con el fondo (gris + capa estática)."""
+        s.fill(self.BG_COLOR, rect)
+        s.blit(self.background, rect.topleft, rect.move(-offset_x, -offset_y))
+
+    def get_dirty_rects(self):
+        """Zonas que cambiaron en el último draw() (None = pantalla completa)."""
+        if self._full_redraw:
+            self._full_redraw = False
+            return None
+        return self._dirty
+
     # -----------------------------------
     # SCORE, VICTORIA Y DERROTA
     # -----------------------------------
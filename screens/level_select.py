@@ -2,17 +2,24 @@ import pygame
 import config
 from screens.base_screen import BaseScreen
 from core.button import Button
-from core.utils import play_music
+from core.utils import play_music, render_text
 from screens.difficulty import DifficultyScreen
 
 
 class LevelSelectScreen(BaseScreen):
+    # Menú estático: sólo se redibuja ante input o cambios de hover
+    continuous = False
+
     def __init__(self, app):
         super().__init__(app)
 
         # Lista de botones (menú, dificultad, flechas de scroll)
         self.buttons = []
 
+        # Estado de la precarga en el último update() (para redibujar
+        # también el frame en que termina y desaparece el progreso)
+        self._preloading = not app.preloader.done
+
         # Construcción inicial de elementos UI
         self._build_ui()
 
@@ -96,6 +103,16 @@ class LevelSelectScreen(BaseScreen):
             self.app.current_music
         )
 
+    # ---------------------------------------------------------
+    #   MIENTRAS SE PRECARGA → el texto de progreso cambia
+    #   (y una vez más cuando termina, para quitarlo)
+    # ---------------------------------------------------------
+    def update(self):
+        preloading = not self.app.preloader.done
+        if preloading or self._preloading:
+            self.invalidate()
+        self._preloading = preloading
+
     # ---------------------------------------------------------
     #   CALCULAR POSICIONES DE LOS ÍCONOS DE NIVELES
     # ---------------------------------------------------------
@@ -177,11 +194,11 @@ class LevelSelectScreen(BaseScreen):
         unlocked = self.app.save_data["levels_unlocked"][diff]
 
         # Título
-        t = self.app.font_large.render("Selecciona un nivel", True, config.COLOR_TEXT)
+        t = render_text(self.app.font_large, "Selecciona un nivel", True, config.COLOR_TEXT)
         s.blit(t, t.get_rect(center=(w // 2, 80)))
 
         # Dificultad actual
-        d = self.app.font_medium.render(f"Dificultad: {diff}", True, config.COLOR_TEXT)
+        d = render_text(self.app.font_medium, f"Dificultad: {diff}", True, config.COLOR_TEXT)
         s.blit(d, d.get_rect(center=(w // 2, 140)))
 
         # Íconos de niveles
@@ -196,11 +213,11 @@ class LevelSelectScreen(BaseScreen):
             pygame.draw.rect(s, (180, 180, 255), r, 3, border_radius=12)
 
             # Número del nivel
-            label = self.app.font_large.render(str(idx + 1), True, config.COLOR_TEXT)
+            label = render_text(self.app.font_large, str(idx + 1), True, config.COLOR_TEXT)
             s.blit(label, label.get_rect(center=(r.centerx, r.centery - 20)))
 
             # Texto "LEVEL"
-            sub = self.app.font_small.render("LEVEL", True, config.COLOR_TEXT)
+            sub = render_text(self.app.font_small, "LEVEL", True, config.COLOR_TEXT)
             s.blit(sub, sub.get_rect(center=(r.centerx, r.bottom - 25)))
 
             # Si está bloqueado → sombrear + icono candado
@@ -217,13 +234,23 @@ class LevelSelectScreen(BaseScreen):
                     lock_rect = lock_img.get_rect(center=r.center)
                     s.blit(lock_img, lock_rect)
                 except:
-                    lock = self.app.font_medium.render("🔒", True, config.COLOR_TEXT)
+                    lock = render_text(self.app.font_medium, "🔒", True, config.COLOR_TEXT)
                     s.blit(lock, lock.get_rect(center=r.center))
 
         # Dibujar botones inferiores
         for b in self.buttons:
             b.draw(s)
 
+        # Progreso de la precarga de recursos (si aún no terminó)
+        preloader = self.app.preloader
+        if not preloader.done:
+            p = render_text(
+                self.app.font_small,
+                f"Cargando recursos... {int(preloader.progress * 100)}%",
+                True, config.COLOR_TEXT
+            )
+            s.blit(p, p.get_rect(bottomright=(w - 20, h - 20)))
+
     # ---------------------------------------------------------
     #   CAMBIAR A MENÚ PRINCIPAL
     # ---------------------------------------------------------
@@ -236,6 +263,9 @@ class LevelSelectScreen(BaseScreen):
     # ---------------------------------------------------------
     def go_gameplay(self, diff, idx):
         from screens.gameplay import GamePlayScreen
+
+        # Terminar la precarga (instantáneo si ya acabó en segundo plano)
+        self.app.preloader.finish()
         self.app.change_screen(
             GamePlayScreen(self.app, diff, idx)
         )
\ No newline at end of file
@@ -1,13 +1,16 @@
 import pygame
 from screens.base_screen import BaseScreen
 from core.button import Button
-from core.utils import play_music
+from core.utils import play_music, render_text
 import config
 from screens.difficulty import DifficultyScreen
 from screens.level_select import LevelSelectScreen
 
 
 class MainMenuScreen(BaseScreen):
+    # Menú estático: sólo se redibuja ante input o cambios de hover
+    continuous = False
+
     def __init__(self, app):
         super().__init__(app)
 
@@ -84,10 +87,10 @@ class MainMenuScreen(BaseScreen):
         # -----------------------------------------------------
         # Títulos principales: "Bombman" + "Menú Principal"
         # -----------------------------------------------------
-        title = self.app.font_large.render("Bombman", True, config.COLOR_TEXT)
+        title = render_text(self.app.font_large, "Bombman", True, config.COLOR_TEXT)
         s.blit(title, title.get_rect(center=(config.WIDTH // 2, 60)))
 
-        subtitle = self.app.font_medium.render("Menú Principal", True, config.COLOR_TEXT)
+        subtitle = render_text(self.app.font_medium, "Menú Principal", True, config.COLOR_TEXT)
         s.blit(subtitle, subtitle.get_rect(center=(config.WIDTH // 2, 120)))
 
         # -----------------------------------------------------
@@ -120,13 +123,13 @@ class MainMenuScreen(BaseScreen):
         # -----------------------------------------------------
         y = panel_y + 20
 
-        header = self.app.font_medium.render("Cómo Jugar", True, config.COLOR_TEXT)
+        header = render_text(self.app.font_medium, "Cómo Jugar", True, config.COLOR_TEXT)
         s.blit(header, (panel_x + 20, y))
         y += header.get_height() + 10
 
         # Listado de reglas y controles
         for line in self.info:
-            t = self.app.font_small.render(line, True, config.COLOR_TEXT)
+            t = render_text(self.app.font_small, line, True, config.COLOR_TEXT)
             s.blit(t, (panel_x + 20, y))
             y += t.get_height() + 15
 
@@ -1,11 +1,14 @@
 import config
 from screens.base_screen import BaseScreen
 from core.button import Button
-from core.utils import play_music
+from core.utils import play_music, render_text
 from core.save_manager import SaveManager
 
 
 class VictoryScreen(BaseScreen):
+    # Menú estático: sólo se redibuja ante input o cambios de hover
+    continuous = False
+
     def __init__(self, app, difficulty, level_index, score):
         super().__init__(app)
 
@@ -109,7 +112,7 @@ class VictoryScreen(BaseScreen):
         w, h = config.WIDTH, config.HEIGHT
 
         # Título principal
-        title = self.app.font_large.render("¡Victoria!", True, config.COLOR_TEXT)
+        title = render_text(self.app.font_large, "¡Victoria!", True, config.COLOR_TEXT)
         s.blit(title, title.get_rect(center=(w // 2, h * 0.2)))
 
         # Información del nivel terminado
@@ -121,7 +124,7 @@ class VictoryScreen(BaseScreen):
 
         y = h * 0.35
         for line in lines:
-            t = self.app.font_medium.render(line, True, config.COLOR_TEXT)
+            t = render_text(self.app.font_medium, line, True, config.COLOR_TEXT)
             s.blit(t, t.get_rect(center=(w // 2, y)))
             y += 45
 
@@ -135,6 +138,9 @@ class VictoryScreen(BaseScreen):
     # ---------------------------------------------------------
     def go_gameplay(self, new_d, new_i):
         from screens.gameplay import GamePlayScreen
+
+        # Terminar la precarga (instantáneo si ya acabó en segundo plano)
+        self.app.preloader.finish()
         self.app.change_screen(GamePlayScreen(self.app, new_d, new_i))
 
         # Se vuelve a ejecutar por seguridad (puedes dejarlo o eliminarlo)